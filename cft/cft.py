@@ -54,34 +54,36 @@ class TeacherData:
 
 class Codes:
     # See https://code4tomorrow.org/class-codes
-    COURSES = {
-        "1": "Java",
-        "2": "Python",
-        "3": "Scratch",
-        "4": "Web Development",
-        "5": "Machine Learning",
-        "6": "JavaScript",
-        "7": "C",
-        "8": "iOS App Development",
-    }
-
-    LEVELS = {"1": "Beginner", "2": "Intermediate", "3": "Advanced", "4": "Games"}
-
-    DAYS = {
-        "1": "Mon & Wed",
-        "2": "Tue & Thur",
-        "3": "Wed & Sat",
-        "4": "Thur & Sun",
-    }
-
-    TIMES = {
-        "1": "12-1 PM Pacific Time",
-        "2": "2-3 PM Pacific Time",
-        "3": "3-4 PM Pacific Time",
-        "4": "4-5 PM Pacific Time",
-        "5": "5-6 PM Pacific Time",
-        "6": "6-7 PM Pacific Time",
-        "7": "7-8 PM Pacific Time",
-        "8": "8-9 PM Pacific Time",
-        "9": "9-10 PM Pacific Time",
-    }
+    # The code digits are dense small ints starting at 1, so these are
+    # tuples indexed by int(digit) - 1 instead of dicts keyed by "1".."9"
+    COURSES = (
+        "Java",  # 1
+        "Python",  # 2
+        "Scratch",  # 3
+        "Web Development",  # 4
+        "Machine Learning",  # 5
+        "JavaScript",  # 6
+        "C",  # 7
+        "iOS App Development",  # 8
+    )
+
+    LEVELS = ("Beginner", "Intermediate", "Advanced", "Games")
+
+    DAYS = (
+        "Mon & Wed",  # 1
+        "Tue & Thur",  # 2
+        "Wed & Sat",  # 3
+        "Thur & Sun",  # 4
+    )
+
+    TIMES = (
+        "12-1 PM Pacific Time",  # 1
+        "2-3 PM Pacific Time",  # 2
+        "3-4 PM Pacific Time",  # 3
+        "4-5 PM Pacific Time",  # 4
+        "5-6 PM Pacific Time",  # 5
+        "6-7 PM Pacific Time",  # 6
+        "7-8 PM Pacific Time",  # 7
+        "8-9 PM Pacific Time",  # 8
+        "9-10 PM Pacific Time",  # 9
+    )
@@ -1,53 +1,83 @@
-from socket import timeout
-
-from cft.cft import StudTeachSheet
-
-from sheets.sheets import ClassRosterSheet
-from datetime import datetime
-
-
-class SheetsManager:
-    def update_setup_class_sheet(self):
-        """
-        Retrieves data from Student Responses and tries to pair
-        the students with the teachers by writing the students
-        and their respective info onto their requested courses.
-        """
-        print("updating and writing to class sheet")
-        try:
-            start_t = datetime.now()
-
-            original_sheet = ClassRosterSheet(
-                StudTeachSheet.SHEET_ID,
-                StudTeachSheet.SHEET_NAME,
-                StudTeachSheet.SCOPES,
-                StudTeachSheet.PATH_TO_CREDS,
-                first_time_setup=True,
-            )
-            original_sheet.write_classes()
-
-            updated_sheet = ClassRosterSheet(
-                StudTeachSheet.SHEET_ID,
-                StudTeachSheet.SHEET_NAME,
-                StudTeachSheet.SCOPES,
-                StudTeachSheet.PATH_TO_CREDS,
-            )
-            updated_sheet.write_placements()
-
-            print(
-                f"finished doing so in {(datetime.now() - start_t).total_seconds()}"
-                + " seconds."
-            )
-        except timeout:
-            print("socket.timeout exception caught")
-        except IndexError as e:
-            print("Someone was editing the sheet while enoch was")
-            print("trying to fetch values (Student Teacher Sheet).")
-            raise e
-        except Exception as e:
-            print("uh oh, something went seriously wrong.")
-            print(type(e), e)
-            raise e  # can be commented out
-
-
-SheetsManager = SheetsManager()
+from concurrent.futures import ThreadPoolExecutor
+
+from cft.cft import StudTeachSheet, TeacherData
+
+from sheets.sheets import ClassRosterSheet, Sheet, get_service
+from datetime import datetime
+
+
+class SheetsManager:
+    def __init__(self):
+        # authorize once so that every sheet built here shares one
+        # connection instead of redoing the TLS handshake per object
+        self.service = get_service(
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+        )
+
+    def update_setup_class_sheet(self):
+        """
+        Retrieves data from Student Responses and tries to pair
+        the students with the teachers by writing the students
+        and their respective info onto their requested courses.
+        Transient failures (socket timeouts, quota 429s) are retried
+        with backoff at the request level (see sheets.backoff), so
+        anything that escapes here is a real error. An IndexError
+        usually means someone was editing the Student Teacher Sheet
+        while values were being fetched.
+        """
+        print("updating and writing to class sheet")
+        start_t = datetime.now()
+
+        # one batchGet shared by both passes instead of
+        # one get request per ClassRosterSheet
+        sheet_data = ClassRosterSheet.from_batch(
+            StudTeachSheet.SHEET_ID,
+            [StudTeachSheet.SHEET_NAME],
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            service=self.service,
+        )
+
+        # the Teacher Data fetch doesn't depend on anything the
+        # roster sheet reads, so overlap it with the construction
+        # of original_sheet instead of waiting for both in sequence
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            teacher_data = executor.submit(
+                Sheet,
+                TeacherData.SHEET_ID,
+                TeacherData.SHEET_NAME,
+                TeacherData.SCOPES,
+                TeacherData.PATH_TO_CREDS,
+            )
+
+            original_sheet = ClassRosterSheet(
+                StudTeachSheet.SHEET_ID,
+                StudTeachSheet.SHEET_NAME,
+                StudTeachSheet.SCOPES,
+                StudTeachSheet.PATH_TO_CREDS,
+                first_time_setup=True,
+                prefetched_values=sheet_data[StudTeachSheet.SHEET_NAME],
+                service=self.service,
+            )
+        # write_classes keeps original_sheet.spreadsheet current,
+        # so the placement pass can reuse it without re-fetching
+        original_sheet.write_classes(reader=teacher_data.result())
+
+        updated_sheet = ClassRosterSheet(
+            StudTeachSheet.SHEET_ID,
+            StudTeachSheet.SHEET_NAME,
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            prefetched_values={"values": original_sheet.spreadsheet},
+            service=self.service,
+        )
+        updated_sheet.write_placements()
+
+        print(
+            f"finished doing so in {(datetime.now() - start_t).total_seconds()}"
+            + " seconds."
+        )
+
+
+SheetsManager = SheetsManager()
@@ -0,0 +1,134 @@
+import random
+import threading
+import time
+from functools import wraps
+from socket import timeout
+
+from googleapiclient.errors import HttpError
+
+# statuses worth retrying: quota exhaustion and transient server errors
+RETRIABLE_STATUSES = (429, 500, 503)
+
+
+def _is_transient(error, extra_types=()):
+    """
+    Returns True if the given exception is worth retrying: a socket
+    timeout, a Sheets API response with a retriable status, or any of
+    the caller-provided extra_types (e.g. SMTP disconnects).
+    """
+    if isinstance(error, timeout):
+        return True
+    if extra_types and isinstance(error, extra_types):
+        return True
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRIABLE_STATUSES
+    return False
+
+
+def _retry_after(error):
+    """
+    Returns the delay in seconds the server asked for via the
+    Retry-After header, or None if there wasn't one. 429 responses
+    often carry this, and sleeping exactly that long beats guessing.
+    """
+    if isinstance(error, HttpError):
+        value = error.resp.get("retry-after")
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def retry_transient(
+    max_tries: int = 6, base: float = 1.0, cap: float = 30.0, extra_types: tuple = ()
+):
+    """
+    Decorator that retries transient failures with random exponential
+    backoff instead of raising (or silently dropping) on the first one.
+    Google returns 429 "quota exceeded" and 503s routinely, and those
+    requests almost always succeed on a later try.
+    Args:
+        max_tries (int): total number of attempts before the last
+            failure is re-raised
+        base (float): the backoff scale; sleep i is drawn uniformly
+            from [0, base * 2**i]
+        cap (float): the longest any single sleep can be, in seconds
+        extra_types (tuple): extra exception types to treat as
+            transient in addition to timeouts and retriable HttpErrors
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_tries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_tries - 1:
+                        raise
+                    if not _is_transient(e, extra_types):
+                        raise
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = min(cap, random.uniform(0, base * 2**attempt))
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+
+class TokenBucket:
+    """
+    Paces requests to a sustained rate while allowing a small burst.
+    The Sheets quota is enforced per minute, but firing several
+    requests back to back still draws 429s even when the average rate
+    is fine; spending one token per request (and sleeping when the
+    bucket is empty) smooths the bursts out. Thread-safe, since sheet
+    fetches sometimes run on worker threads.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate  # tokens regained per second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.updated = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= 1
+
+
+# one bucket for the whole process, since the quota is per user, not
+# per Sheet object. 1 req/s sustained matches the 60 writes/min limit
+_request_bucket = TokenBucket(rate=1.0, burst=5)
+
+
+def execute_with_backoff(
+    request, max_tries: int = 6, base: float = 1.0, cap: float = 30.0
+):
+    """
+    Calls .execute() on a prepared Sheets API request, pacing requests
+    through the process-wide token bucket and retrying transient
+    failures per retry_transient's backoff policy. Use this in place
+    of bare request.execute() for every Sheets call.
+    """
+
+    def paced_execute():
+        _request_bucket.acquire()
+        return request.execute()
+
+    return retry_transient(max_tries=max_tries, base=base, cap=cap)(paced_execute)()
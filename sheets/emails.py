@@ -1,98 +1,162 @@
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from pathlib import Path
-
-
-class Emails:
-    # Import the account and password from lib.cft.cft probably
-    def __init__(self, account: str, password: str):
-        self.account = account
-        self.password = password
-
-    def send_email(self, message: MIMEMultipart, recipients: list):
-        try:
-            server = smtplib.SMTP_SSL("smtp.gmail.com")
-            server.ehlo()
-            server.login(self.account, self.password)
-            server.sendmail(self.account, recipients, message.as_string())
-        except smtplib.SMTPServerDisconnected:
-            pass
-
-    def create_message(
-        self,
-        recipients: list,
-        email_data: dict,
-        student,
-        class_code,
-    ):
-        # Note: the plain text one is only there in case someone is using
-        # an email client that doesn't support html emails, or they turned
-        # it off for some reason.
-        text_path = Path(__file__).parent / email_data["text_path"]
-        with text_path.open() as f:
-            text_email = f.read()
-            text_email = text_email.replace("XXXXX", class_code)
-            text_email = text_email.replace("YYYYY", student)
-            text_part = MIMEText(text_email, "plain")
-
-        # Note: the html one is what 99.99% of people will see, this is
-        # how we add links, text formating, headings, etc to our emails.
-        html_email = Path(__file__).parent / email_data["html_path"]
-        with html_email.open() as f:
-            html_email = f.read()
-            html_email = html_email.replace("XXXXX", class_code)
-            html_email = html_email.replace("YYYYY", student)
-            html_part = MIMEText(html_email, "html")
-
-        message = MIMEMultipart("alternative", _subparts=(text_part, html_part))
-        message["Subject"] = email_data["subject"]
-        message["From"] = self.account
-        message["To"] = ",".join(recipients)
-
-        return message
-
-    def send_welcome_emails(self, recipients: list, student, class_code):
-        email_data = {
-            "subject": "Code 4 Tomorrow - XXXXX Acceptance",
-            "text_path": "./emails/welcome.txt",
-            "html_path": "./emails/welcome.html",
-        }
-        email_data["subject"] = email_data["subject"].replace("XXXXX", class_code)
-        email = self.create_message(
-            recipients,
-            email_data,
-            student,
-            class_code,
-        )
-        self.send_email(email, recipients)
-
-    def send_class_full_emails(self, recipients: list, student, class_code):
-        email_data = {
-            "subject": "Code 4 Tomorrow - XXXXX Class Full",
-            "text_path": "./emails/class_full.txt",
-            "html_path": "./emails/class_full.html",
-        }
-        email_data["subject"] = email_data["subject"].replace("XXXXX", class_code)
-        email = self.create_message(
-            recipients,
-            email_data,
-            student,
-            class_code,
-        )
-        self.send_email(email, recipients)
-
-    def send_invalid_code_emails(self, recipients: list, student, class_code):
-        email_data = {
-            "subject": "Code 4 Tomorrow - XXXXX Invalid Class Code",
-            "text_path": "./emails/invalid_code.txt",
-            "html_path": "./emails/invalid_code.html",
-        }
-        email_data["subject"] = email_data["subject"].replace("XXXXX", class_code)
-        email = self.create_message(
-            recipients,
-            email_data,
-            student,
-            class_code,
-        )
-        self.send_email(email, recipients)
+from functools import lru_cache
+from pathlib import Path
+
+from sheets.backoff import retry_transient
+
+# smtplib and email.mime are imported lazily inside the methods that
+# need them, so runs that never send an email skip the import cost
+
+
+# one registry for every kind of email we send instead of a dict
+# literal rebuilt inside each send_* method on every call. Subjects
+# keep the XXXXX marker; the class code is filled in at send time.
+EMAIL_KINDS = {
+    "welcome": {
+        "subject": "Code 4 Tomorrow - XXXXX Acceptance",
+        "text_path": "./emails/welcome.txt",
+        "html_path": "./emails/welcome.html",
+    },
+    "class_full": {
+        "subject": "Code 4 Tomorrow - XXXXX Class Full",
+        "text_path": "./emails/class_full.txt",
+        "html_path": "./emails/class_full.html",
+    },
+    "invalid_code": {
+        "subject": "Code 4 Tomorrow - XXXXX Invalid Class Code",
+        "text_path": "./emails/invalid_code.txt",
+        "html_path": "./emails/invalid_code.html",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _load_template(path: Path) -> str:
+    """
+    Reads an email template from disk once and caches it, so that a
+    batch of N emails doesn't reopen and reread the same .txt/.html
+    file N times. The sheet-style XXXXX/YYYYY placeholders are
+    converted into str.format fields here (once), so each send does a
+    single format_map pass instead of chained full-body replaces.
+    """
+    with path.open() as f:
+        template = f.read()
+
+    # escape any literal braces first so format_map can't trip on them
+    template = template.replace("{", "{{").replace("}", "}}")
+    return template.replace("XXXXX", "{class_code}").replace("YYYYY", "{student}")
+
+
+class Emails:
+    # Import the account and password from lib.cft.cft probably
+    def __init__(self, account: str, password: str):
+        self.account = account
+        self.password = password
+        self.server = None
+
+    def _connect(self):
+        """
+        Opens (or reopens) the SMTP_SSL connection and logs in.
+        One connection is held for the whole run so that each email
+        doesn't pay for its own TLS handshake + login round trip.
+        Transient connect failures are retried with backoff.
+        """
+        import smtplib
+
+        @retry_transient(extra_types=(smtplib.SMTPException, OSError))
+        def connect():
+            self.server = smtplib.SMTP_SSL("smtp.gmail.com")
+            self.server.ehlo()
+            self.server.login(self.account, self.password)
+
+        connect()
+
+    def send_email(self, message, recipients: list):
+        import smtplib
+
+        if self.server is None:
+            self._connect()
+        try:
+            self.server.sendmail(self.account, recipients, message.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # the server hung up on our idle connection; reconnect
+            # and retry once before giving up on this message
+            try:
+                self._connect()
+                self.server.sendmail(self.account, recipients, message.as_string())
+            except smtplib.SMTPServerDisconnected:
+                pass
+
+    def close(self):
+        """
+        Closes the SMTP connection if one is open. Safe to call even
+        if nothing was ever sent.
+        """
+        if self.server is not None:
+            import smtplib
+
+            try:
+                self.server.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
+            self.server = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def create_message(
+        self,
+        recipients: list,
+        email_data: dict,
+        student,
+        class_code,
+    ):
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+
+        fills = {"class_code": class_code, "student": student}
+
+        # Note: the plain text one is only there in case someone is using
+        # an email client that doesn't support html emails, or they turned
+        # it off for some reason.
+        text_email = _load_template(Path(__file__).parent / email_data["text_path"])
+        text_part = MIMEText(text_email.format_map(fills), "plain")
+
+        # Note: the html one is what 99.99% of people will see, this is
+        # how we add links, text formating, headings, etc to our emails.
+        html_email = _load_template(Path(__file__).parent / email_data["html_path"])
+        html_part = MIMEText(html_email.format_map(fills), "html")
+
+        message = MIMEMultipart("alternative", _subparts=(text_part, html_part))
+        message["Subject"] = email_data["subject"]
+        message["From"] = self.account
+        message["To"] = ",".join(recipients)
+
+        return message
+
+    def send_emails(self, kind: str, recipients: list, student, class_code):
+        """
+        Builds and sends one of the registered kinds of email (see
+        EMAIL_KINDS for the valid kinds). The three send_*_emails
+        methods are thin wrappers around this.
+        """
+        email_data = dict(EMAIL_KINDS[kind])
+        email_data["subject"] = email_data["subject"].replace("XXXXX", class_code)
+        email = self.create_message(
+            recipients,
+            email_data,
+            student,
+            class_code,
+        )
+        self.send_email(email, recipients)
+
+    def send_welcome_emails(self, recipients: list, student, class_code):
+        self.send_emails("welcome", recipients, student, class_code)
+
+    def send_class_full_emails(self, recipients: list, student, class_code):
+        self.send_emails("class_full", recipients, student, class_code)
+
+    def send_invalid_code_emails(self, recipients: list, student, class_code):
+        self.send_emails("invalid_code", recipients, student, class_code)
@@ -1,197 +1,255 @@
-from uuid import uuid4
-
-
-class Person:
-    def __init__(self, first: str, last: str, email: str = None):
-        """
-        Initializes a Person object
-        Args:
-            first (str): person's first name
-            last (str): person's last name
-            email (str, optional): person's email. Defaults to None.
-        """
-        self.first = first.strip()
-        self.last = last.strip()
-        self.full_name = self.first + " " + self.last
-
-        if email is not None:
-            self.email = email.strip().lower()
-        else:
-            self.email = email
-
-        # Generates a random (v4) universally unique identifier
-        self.id = str(uuid4())
-
-    def __eq__(self, o: object) -> bool:
-        if isinstance(o, Person):
-            return o.id == self.id
-        else:
-            return False
-
-    def __ne__(self, o: object) -> bool:
-        if isinstance(o, Person):
-            return o.id != self.id
-        else:
-            return False
-
-    def __str__(self) -> str:
-        return f"Full name: {self.full_name}, Email: {self.email}, UUID: {self.id}"
-
-
-class Student(Person):
-    MAX_ENROLLMENTS = 3
-
-    def __init__(
-        self,
-        first: str,
-        last: str,
-        email: str = None,
-        note: str = None,
-        parents: list = [],
-        classes: list = [],
-    ):
-        """
-        Initializes a Student object
-        Args:
-            first (str): student's first name
-            last (str): student's last name
-            email (str, optional): student's email. Defaults to None.
-            note (str, optional): extra info on the student. Defaults to None.
-            parents (list, optional): list of the student's parents' UUIDs.
-                Defaults to an empty list.
-            classes (list, optional): list of the student's class codes.
-                Defaults to an empty list.
-        """
-        super().__init__(first, last, email)
-
-        self.note = note
-        self.set_parents(parents)
-        self.set_classes(classes)
-
-    def set_parents(self, parents: list):
-        """
-        Sets this student's parents attribute
-        Args:
-            parents (list): list of the student's parents' UUIDs
-        Raises:
-            ValueError: If the student has more than 2 parents
-        """
-        if len(parents) > 2:
-            raise ValueError(
-                "A Student cannot have more than 2 parents.\n"
-                f"\tParent list: {parents}\n"
-                f"\tStudent: {self}\n"
-            )
-
-        self.parents = parents
-
-    def set_classes(self, classes: list):
-        """
-        Sets this student's the classes attribute
-        Args:
-            classes (list): list of this student's class codes
-        Raises:
-            ValueError: If the student is enrolled in more than MAX_ENROLLMENTS classes
-        """
-        if len(classes) > Student.MAX_ENROLLMENTS:
-            raise ValueError(
-                f"A Student cannot have more than {Student.MAX_ENROLLMENTS} classes.\n"
-                f"\tStudent: {self}"
-            )
-
-        self.classes = classes
-
-
-class Parent(Person):
-    def __init__(self, first: str, last: str, email: str, children: list = []):
-        """
-        Initializes a Parent object
-        Args:
-            first (str): parent's first name
-            last (str): parent's last name
-            email (str): parent's email
-            children (list, optional): list of student string UUIDs for each child
-        """
-        super().__init__(first, last, email)
-
-        self.children = children
-
-
-class Teacher(Person):
-    MAX_CLASSES = 3
-
-    def __init__(
-        self,
-        first: str,
-        last: str,
-        email: str,
-        phone: str,
-        classes: list = [],
-    ):
-        """
-        Initializes a Teacher object
-        Args:
-            first (str): teacher's first name
-            last (str): teacher's last name
-            email (str): teacher's email
-            phone (str): teacher's phone number
-            classes (list, optional): class codes this teacher is teaching
-        """
-        super().__init__(first, last, email)
-
-        self.phone = phone
-        self.set_classes(classes)
-
-    def set_classes(self, classes: list):
-        """
-        Sets this teacher's classes attribute
-        Args:
-            classes (list): list of this teacher's class codes
-        Raises:
-            ValueError: If the teacher is teaching more than MAX_CLASSES classes
-        """
-        if len(classes) > Teacher.MAX_CLASSES:
-            raise ValueError(
-                f"A Teacher cannot have more than {Teacher.MAX_CLASSES} classes.\n"
-                f"\tClasses list: {classes}\n"
-                f"\tTeacher: {self}\n"
-            )
-
-        self.classes = classes
-
-
-class Member(Person):
-    def __init__(
-        self,
-        first: str,
-        last: str,
-        email: str,
-        phone: str,
-        departments: list = [str],
-        projects: list = [str],
-    ):
-        """
-        Initializes a Parent object
-        Args:
-            first (str): member's first name
-            last (str): member's last name
-            email (str): member's email
-            departments (list[str]): list of this member's departments
-            projects (list[str]): list of this member's projects
-        """
-        super().__init__(first, last, email)
-
-        self.phone = phone
-        self.departments = departments
-        self.projects = projects
-
-
-class Ambassador(Person):
-    def __init__(
-        self,
-        first: str,
-        last: str,
-        email: str,
-        pronouns: str,
-    ):
-        self.pronouns = pronouns
+from itertools import count
+from sys import intern
+
+# uuid is imported lazily in Person.id: only the first freshly
+# generated id of a run needs it
+
+
+class Person:
+    __slots__ = ("first", "last", "email", "_full_name", "_id")
+
+    # new ids are handed out as "<run uuid>-<n>": one uuid4 drawn per
+    # process plus a cheap counter, instead of a fresh uuid4 (an OS
+    # entropy read) per Person. The random run prefix keeps ids that
+    # get written onto the sheets unique across runs.
+    _run_id = None
+    _id_counter = count()
+
+    def __init__(self, first: str, last: str, email: str = None):
+        """
+        Initializes a Person object
+        Args:
+            first (str): person's first name
+            last (str): person's last name
+            email (str, optional): person's email. Defaults to None.
+        """
+        # intern the names since many people share first/last names,
+        # so duplicates point at one string instead of N copies
+        self.first = intern(first.strip())
+        self.last = intern(last.strip())
+        self._full_name = None
+
+        if email is not None:
+            self.email = email.strip().lower()
+        else:
+            self.email = email
+
+        self._id = None
+
+    @property
+    def full_name(self):
+        """
+        The person's "first last" name, built on first access instead
+        of eagerly for every row read off a sheet.
+        """
+        if self._full_name is None:
+            self._full_name = self.first + " " + self.last
+        return self._full_name
+
+    @property
+    def id(self):
+        """
+        The person's unique id. Only generated on first access, so
+        objects that get their id off an existing sheet row never pay
+        for one. See _run_id above for the id scheme.
+        """
+        if self._id is None:
+            if Person._run_id is None:
+                from uuid import uuid4
+
+                Person._run_id = str(uuid4())
+            self._id = f"{Person._run_id}-{next(Person._id_counter)}"
+        return self._id
+
+    @id.setter
+    def id(self, value):
+        self._id = value
+
+    def __eq__(self, o: object) -> bool:
+        if isinstance(o, Person):
+            return o.id == self.id
+        else:
+            return False
+
+    def __ne__(self, o: object) -> bool:
+        if isinstance(o, Person):
+            return o.id != self.id
+        else:
+            return False
+
+    def __str__(self) -> str:
+        return f"Full name: {self.full_name}, Email: {self.email}, UUID: {self.id}"
+
+
+class Student(Person):
+    MAX_ENROLLMENTS = 3
+
+    # only the attributes Student adds; Person's are inherited
+    __slots__ = ("note", "parents", "classes")
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        email: str = None,
+        note: str = None,
+        parents: list = None,
+        classes: list = None,
+    ):
+        """
+        Initializes a Student object
+        Args:
+            first (str): student's first name
+            last (str): student's last name
+            email (str, optional): student's email. Defaults to None.
+            note (str, optional): extra info on the student. Defaults to None.
+            parents (list, optional): list of the student's parents' UUIDs.
+                Defaults to an empty list.
+            classes (list, optional): list of the student's class codes.
+                Defaults to an empty list.
+        """
+        super().__init__(first, last, email)
+
+        self.note = note
+        self.set_parents(parents if parents is not None else [])
+        self.set_classes(classes if classes is not None else [])
+
+    def set_parents(self, parents: list):
+        """
+        Sets this student's parents attribute. Kept as a list on
+        purpose: the order is meaningful (parents[0] is written to the
+        roster as Parent 1) and the size is bounded at 2
+        Args:
+            parents (list): list of the student's parents' UUIDs
+        Raises:
+            ValueError: If the student has more than 2 parents
+        """
+        if len(parents) > 2:
+            raise ValueError(
+                "A Student cannot have more than 2 parents.\n"
+                f"\tParent list: {parents}\n"
+                f"\tStudent: {self}\n"
+            )
+
+        self.parents = parents
+
+    def set_classes(self, classes: list):
+        """
+        Sets this student's the classes attribute. Kept as a list on
+        purpose: placement appends to it in choice order and the size
+        is bounded at MAX_ENROLLMENTS
+        Args:
+            classes (list): list of this student's class codes
+        Raises:
+            ValueError: If the student is enrolled in more than MAX_ENROLLMENTS classes
+        """
+        if len(classes) > Student.MAX_ENROLLMENTS:
+            raise ValueError(
+                f"A Student cannot have more than {Student.MAX_ENROLLMENTS} classes.\n"
+                f"\tStudent: {self}"
+            )
+
+        self.classes = classes
+
+
+class Parent(Person):
+    __slots__ = ("children",)
+
+    def __init__(self, first: str, last: str, email: str, children: list = None):
+        """
+        Initializes a Parent object
+        Args:
+            first (str): parent's first name
+            last (str): parent's last name
+            email (str): parent's email
+            children (list, optional): list of student string UUIDs for each child
+        """
+        super().__init__(first, last, email)
+
+        self.children = children if children is not None else []
+
+
+class Teacher(Person):
+    MAX_CLASSES = 3
+
+    __slots__ = ("phone", "classes")
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        email: str,
+        phone: str,
+        classes: list = None,
+    ):
+        """
+        Initializes a Teacher object
+        Args:
+            first (str): teacher's first name
+            last (str): teacher's last name
+            email (str): teacher's email
+            phone (str): teacher's phone number
+            classes (list, optional): class codes this teacher is teaching
+        """
+        super().__init__(first, last, email)
+
+        self.phone = phone
+        self.set_classes(classes if classes is not None else [])
+
+    def set_classes(self, classes: list):
+        """
+        Sets this teacher's classes attribute
+        Args:
+            classes (list): list of this teacher's class codes
+        Raises:
+            ValueError: If the teacher is teaching more than MAX_CLASSES classes
+        """
+        if len(classes) > Teacher.MAX_CLASSES:
+            raise ValueError(
+                f"A Teacher cannot have more than {Teacher.MAX_CLASSES} classes.\n"
+                f"\tClasses list: {classes}\n"
+                f"\tTeacher: {self}\n"
+            )
+
+        self.classes = classes
+
+
+class Member(Person):
+    __slots__ = ("phone", "departments", "projects")
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        email: str,
+        phone: str,
+        departments: list = None,
+        projects: list = None,
+    ):
+        """
+        Initializes a Parent object
+        Args:
+            first (str): member's first name
+            last (str): member's last name
+            email (str): member's email
+            departments (list[str]): list of this member's departments
+            projects (list[str]): list of this member's projects
+        """
+        super().__init__(first, last, email)
+
+        self.phone = phone
+        self.departments = departments if departments is not None else []
+        self.projects = projects if projects is not None else []
+
+
+class Ambassador(Person):
+    __slots__ = ("pronouns",)
+
+    def __init__(
+        self,
+        first: str,
+        last: str,
+        email: str,
+        pronouns: str,
+    ):
+        self.pronouns = pronouns
@@ -1,1318 +1,1700 @@
-import os
-import pickle
-from dotenv import load_dotenv
-from sheets._class import Class
-from sheets.emails import Emails
-from sheets.people import Parent, Student, Teacher
-from cft.cft import StudTeachSheet, StudResponses, Email, Codes, TeacherData
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-
-from typing import Union
-
-
-class FormResponse:
-    def __init__(
-        self,
-        student_first: str,
-        student_last: str,
-        parent1_first: str,
-        parent1_last: str,
-        parent1_email: str,
-        choices: list,
-        student_email: str = None,
-        student_note: str = None,
-        parent2_first: str = None,
-        parent2_last: str = None,
-        parent2_email: str = None,
-    ):
-        """
-        Initializes a FormResponse object, represents an individual
-            registration form submission
-        Args:
-            student_first (str): The first name of the student according
-                to their form response
-            student_last (str): The last name of the student according
-                to their form response
-            student_email (str): The email of the student according
-                to their form response, Default: None
-            student_note (str): The note of the student left during their
-                form submission, Default: None
-            parent1_first (str): The first name of the first parent according
-                to their form response
-            parent1_last (str): The last name of the first parent according
-                to their form response
-            parent1_email (str): The email of the first parent according
-                to their form response
-            parent2_first (str): The first name of the second parent according
-                to their form response, Default: None
-            parent2_last (str): The last name of the second parent according
-                to their form response, Default: None
-            parent2_email (str): The email of the second parent according
-                to their form response, Default: None
-            choices (list): A list of the first choice, second choice, and
-                third choice class codes (class codes are of type int)
-        """
-        self.student_first = student_first
-        self.student_last = student_last
-        self.student_email = student_email
-        self.student_note = student_note
-
-        self.parent1_first = parent1_first
-        self.parent1_last = parent1_last
-        self.parent1_email = parent1_email
-
-        self.parent2_first = parent2_first
-        self.parent2_last = parent2_last
-        self.parent2_email = parent2_email
-
-        self.choices = choices
-
-    def get_student(self):
-        """
-        Returns a Student object based on the student's first, last,
-            email, and note. DOES NOT PLACE THE STUDENT ANYWHERE.
-        """
-        return (
-            Student(
-                self.student_first,
-                self.student_last,
-                email=self.student_email,
-                note=self.student_note,
-                parents=[],
-                classes=[],
-            ),
-            self.choices,
-        )
-
-    def get_parent1(self, children=[]):
-        """
-        Returns a Parent object based on the first parent's first, last,
-            email, and inputted children. Does not place the parent anywhere.
-        """
-        return Parent(
-            self.parent1_first,
-            self.parent1_last,
-            self.parent1_email,
-            children,
-        )
-
-    def get_parent2(self, children=[]):
-        """
-        Returns a Parent object based on the second parent's first, last,
-            email, and inputted children. Does not place the parent anywhere.
-        """
-        return Parent(
-            self.parent2_first,
-            self.parent2_last,
-            self.parent2_email,
-            children,
-        )
-
-
-class Sheet:
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        scopes: list,
-        path_to_credentials: str,
-    ):
-        """
-        Initializes a Sheet object
-        Args:
-            id (str): the long alphanumerical found in the Google Sheets URL
-                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
-            name (str): the name of the sheet (the little tabs at the bottom)
-                inside your spreadsheet you want to access. For example, if you have
-                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
-                specify which one you want to access. Ex: 'Email'
-            scopes (list): a list of a link to the authorization that you want to
-                give this SheetAccessor. You can find all scopes at
-                https://developers.google.com/identity/protocols/oauth2/scopes.
-                If you just want it to be able to read, use
-                https://www.googleapis.com/auth/spreadsheets.readonly.
-            path_to_credentials (str): the relative path towards the credentials.json
-                file
-        """
-        self.id = id
-        self.name = name
-        self.scopes = scopes
-        self.path_to_credentials = path_to_credentials
-
-        self.creds = None
-        if os.path.exists("token.pickle"):
-            with open("token.pickle", "rb") as token:
-                self.creds = pickle.load(token)
-        # If there are no (valid) credentials available, let the user log in.
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.path_to_creds, self.scopes
-                )
-                self.creds = flow.run_local_server(port=0)
-            # Save the credentials for the next run
-            with open("token.pickle", "wb") as token:
-                pickle.dump(self.creds, token)
-
-        self.service = build("sheets", "v4", credentials=self.creds)
-        self.sheet = self.service.spreadsheets()
-
-        # a very large range to make sure that we get all data
-        range_name = self.name + "!A1:ZZ1000"
-        result = (
-            self.sheet.values().get(spreadsheetId=self.id, range=range_name).execute()
-        )
-
-        self.spreadsheet = result.get("values", [])
-
-        # used if ever a prepareBatchWrite is used
-        self.batch_write_request = {"requests": []}
-
-    def get_column(self, index: int):
-        """
-        returns a List[str] of each item in the column at the given index position.
-        The list is in order from top to bottom.
-        Args:
-            index (int): position of the column on the spreadsheet. An index of 0
-                indicates the first column on the left.
-        """
-        result = []
-
-        for row in self.spreadsheet:
-            try:
-                result.append(row[index])
-            except IndexError:
-                result.append(None)
-
-        if result == [None] * len(self.spreadsheet):
-            return
-        else:
-            return result
-
-    def get_row(self, index: int):
-        """
-        returns a List[str] of each item in the row at the given index position.
-        The list is in order from left to right.
-        Args:
-            index (int): position of the row on the spreadsheet. An index of 0
-                indicates the first row at the top.
-        """
-        try:
-            return self.spreadsheet[index]
-        except IndexError:
-            print(f"Index {index} not in range.")
-            return None
-
-    def write_column(self, data: list, index: int):
-        """
-        Writes the given data to a column at the given index position.
-        Each element in the data list occupies one cell in the column.
-        Data is written from top to bottom.
-        Args:
-            data (list): a list of strings that you want to write onto the sheet
-            index (int): position of the column on the spreadsheet. An index of 0
-                indicates the first column on the left.
-        """
-        value = {"values": [list(cell) for cell in data]}
-        range_name = self.name + f"!{chr(index + 65)}{1}:{chr(index + 65)}{len(data)}"
-
-        try:
-            self.sheet.values().update(
-                spreadsheetId=self.id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=value,
-            ).execute()
-        except HttpError:
-            self.sheet.values().append(
-                spreadsheetId=self.id,
-                range=range_name,
-                valueInputOption="RAW",
-                insertDataOption="INSERT_ROWS",
-                body=value,
-            ).execute()
-
-    def write_row(self, data: list, index: int):
-        """
-        Writes the given data to a row at the given index position.
-        Each element in the data list occupies one cell in the row.
-        Data is written from left to right.
-        Args:
-            data (list): a list of strings that you want to write onto the sheet
-            index (int): position of the row on the spreadsheet. An index of 0
-                indicates the first row at the top.
-        """
-        value = {"values": [list(data)]}
-        range_name = self.name + f"!A{index + 1}:{chr(len(data) + 64)}{index + 1}"
-
-        try:
-            self.sheet.values().update(
-                spreadsheetId=self.id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=value,
-            ).execute()
-        except HttpError:
-            self.sheet.values().append(
-                spreadsheetId=self.id,
-                range=range_name,
-                valueInputOption="RAW",
-                insertDataOption="INSERT_ROWS",
-                body=value,
-            ).execute()
-
-    def prepare_batch_write_row(self, writing_data: list, code: str):
-        """
-        AS OF NOW, THIS ONLY APPENDS DATA ROWS.
-        If you want to do a more targeted operation,
-        like writing to a specific row, just use
-        write_row
-
-        Arguments:
-            writing_data: list - a 1D list to write
-            code : str - the class code
-        """
-        for item in self.batch_write_request["requests"]:
-            if item["appendCells"]["sheetId"] == int(code):
-                item["appendCells"]["rows"].append(
-                    {
-                        "values": [
-                            {"userEnteredValue": {"stringValue": str(column)}}
-                            for column in writing_data
-                        ]
-                    }
-                )
-                break
-        else:
-            self.batch_write_request["requests"].append(
-                {
-                    "appendCells": {
-                        "sheetId": code,
-                        "rows": [
-                            {
-                                "values": [
-                                    {"userEnteredValue": {"stringValue": str(column)}}
-                                    for column in writing_data
-                                ]
-                            }
-                        ],
-                        "fields": "userEnteredValue",
-                    }
-                }
-            )
-
-    def run_batch_update(self):
-        """
-        runs the prepared batch_write request
-        """
-        self.sheet.batchUpdate(
-            spreadsheetId=self.id, body=self.batch_write_request
-        ).execute()
-        self.batch_write_request = {"requests": []}
-
-
-class ReadOnlyError(Exception):
-    pass
-
-
-class SheetLike(Sheet):
-    """
-    A SheetLike object is an object that works just like a sheet,
-    but is READONLY
-    """
-
-    def __init__(self, sheet_data):
-        """
-        Initializes a SheetLike object. It has all the read methods of a
-        Sheet object, but is READONLY!! Attempting to call write_row or
-        write_column will raise a ReadOnlyError
-        Args
-            sheet_data (dict) : the basic data for the sheet. It should be in
-            the raw form (ie a dictionary with keys like 'range',
-            'values', 'majorDimension'). This is what is returned from a single
-            get request
-        """
-        self.spreadsheet = sheet_data.get("values", [])
-
-    def write_row(self, data: list, index: int):
-        raise ReadOnlyError
-
-    def simulate_write_row(self, data: list, index: int):
-        """
-        Updtes the simulated sheet's values.
-        DOES NOT UPDATE THE REMOTE SHEET'S VALUES
-        """
-        lst = []
-        for i in range(len(self.spreadsheet[0])):
-            if i < len(data):
-                lst.append(data[i])
-            else:
-                lst.append(None)  # just in case len(data) != len(self.spreadsheet[0])
-        if index < len(self.spreadsheet):
-            self.spreadsheet[index] = lst
-        else:
-            while len(self.spreadsheet) <= index:
-                self.spreadsheet.append([])
-            self.spreadsheet[index] = lst
-
-    def write_column(self, data: list, index: int):
-        raise ReadOnlyError  # yeah TODO maybe implement
-
-
-class SheetBatchGet:
-    LARGE_RANGE = "A1:ZZ1000"
-    MASTER_SHEET_NAME = "Classes"
-
-    def __init__(
-        self,
-        id: str,
-        names: list = [],
-        scopes: list = ["https://www.googleapis.com/auth/spreadsheets.readonly"],
-        path_to_credentials: str = "./data/credentials.json",
-    ):
-        """
-        Uses batchGet to create data in self.sheet_data. This is used to get
-        all the data used to instantiate SheetLike objects.
-        """
-        self.id = id
-
-        ranges_provided = len(names) > 0
-        if ranges_provided:
-            # very large ranges to make sure we get all data
-            self.names = [
-                f"{code}!{SheetBatchGet.LARGE_RANGE}"
-                for code in names
-                if code is not None
-            ]
-        else:
-            self.names = SheetBatchGet.LARGE_RANGE
-        self.scopes = scopes
-        self.path_to_credentials = path_to_credentials
-
-        self.creds = None
-        if os.path.exists("token.pickle"):
-            with open("token.pickle", "rb") as token:
-                self.creds = pickle.load(token)
-        # no (valid) credentials available
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.path_to_credentials, self.scopes
-                )
-                self.creds = flow.run_local_server(port=0)
-            # save the credentials for next run
-            with open("token.pickle", "wb") as token:
-                pickle.dump(self.creds, token)
-
-        self.service = build("sheets", "v4", credentials=self.creds)
-        self.sheet = self.service.spreadsheets()
-
-        extra_data = None
-        if ranges_provided:
-            result = (
-                self.sheet.values()
-                .batchGet(spreadsheetId=self.id, ranges=self.names)
-                .execute()
-            )
-        else:
-            extra_data = (
-                self.sheet.values()
-                .get(
-                    spreadsheetId=self.id,
-                    range=SheetBatchGet.MASTER_SHEET_NAME + "!" + self.names,
-                )
-                .execute()
-            )
-            all_names = SheetLike(extra_data).get_column(0)[1:]
-            self.names = [code + "!" + SheetBatchGet.LARGE_RANGE for code in all_names]
-            result = (
-                self.sheet.values()
-                .batchGet(spreadsheetId=self.id, ranges=self.names)
-                .execute()
-            )
-
-        # all_data contains individual sheet data, which
-        # can be accessed using the readonly SheetLike class
-        # by doing `a = SheetLike((SheetBatchGet object).all_data[code])`
-        all_data = result.get("valueRanges")
-        self.sheet_data = {
-            self.names[i].rstrip(SheetBatchGet.LARGE_RANGE).rstrip("!"): all_data[i]
-            for i in range(len(self.names))
-        }
-        self.sheet_data["Classes"] = extra_data
-
-
-class StudentRegistrationSheet(Sheet):
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        scopes: list,
-        path_to_credentials: str,
-    ):
-        """
-        Initializes a StudentRegistrationSheet object
-        Args:
-            id (str): the long alphanumerical found in the Google Sheets URL
-                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
-            name (str): the name of the sheet (the little tabs at the bottom)
-                inside your spreadsheet you want to access. For example, if you have
-                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
-                specify which one you want to access. Ex: 'Email'
-            scopes (list): a list of a link to the authorization that you want to
-                give this SheetAccessor. You can find all scopes at
-                https://developers.google.com/identity/protocols/oauth2/scopes.
-                If you just want it to be able to read, use
-                https://www.googleapis.com/auth/spreadsheets.readonly.
-            path_to_credentials (str): the relative path towards the credentials.json
-                file
-        """
-        super().__init__(id, name, scopes, path_to_credentials)
-
-        load_dotenv()
-        self.Emailer = Emails(
-            Email.NOREPLY,
-            os.getenv("NOREPLY_PASSWORD"),
-        )
-
-        self.responses = self.get_form_responses()
-        self.students, self.parents = self.get_students_parents()
-
-    def get_form_responses(self):
-        """
-        Returns a List[FormResponse] of ALL student registration form responses.
-        """
-        responses = []
-
-        for i in range(1, len(self.spreadsheet)):
-            row = self.spreadsheet[i]
-
-            if len(row) == 0:
-                continue
-
-            info = [
-                row[3].strip(),
-                row[4].strip(),
-                row[6].strip(),
-                row[7].strip(),
-                row[8].strip(),
-                [code.strip() for code in row[25:27] if code.strip() != ""],
-                row[5].strip(),
-                row[23].strip(),
-                row[9].strip(),
-                row[10].strip(),
-                row[11].strip(),
-            ]
-
-            responses.append(FormResponse(*info))
-
-        return responses
-
-    def get_students_parents(self):
-        """
-        Returns dict[str:Student] and dict[str:Parent] of ALL unique students
-        and parents who registered for this class series. The keys are those
-        students' and parents' UUID string.
-        """
-        students = {}
-        parents = {}
-        info_list = []
-
-        invalid_sheet = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Invalid Code Emails",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        full_class_sheet = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Full Class Emails",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        invalid_sheet_info = list(
-            zip(
-                invalid_sheet.get_column(0),
-                invalid_sheet.get_column(1),
-                invalid_sheet.get_column(2),
-                invalid_sheet.get_column(3),
-            )
-        )
-
-        full_class_sheet_info = list(
-            zip(
-                full_class_sheet.get_column(0),
-                full_class_sheet.get_column(1),
-                full_class_sheet.get_column(2),
-                full_class_sheet.get_column(3),
-            )
-        )
-
-        all_rosters = SheetBatchGet(
-            StudTeachSheet.SHEET_ID,
-        )
-        parent_sheet = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Parents",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        for i in range(1, len(parent_sheet.get_column(0))):
-            parent = parent_sheet.get_row(i)
-
-            if len(parent) < 3:
-                continue
-            elif len(parent) == 3:
-                e = ""
-            else:
-                e = parent[3]
-
-            parents[parent[0]] = Parent(
-                parent[1].strip(),
-                parent[2].strip(),
-                e,
-                [],
-            )
-            parents[parent[0]].id = parent[0]
-
-        class_to_planned_writes = {code: 0 for code in all_rosters.sheet_data}
-        for r in self.responses:
-            stud_info = (
-                r.student_first,
-                r.student_last,
-                r.parent1_first,
-                r.parent1_last,
-            )
-
-            if stud_info not in info_list:
-                info_list.append(stud_info)
-                student, choices = r.get_student()
-                student, unaccepted, invalid = self.place_student(
-                    student,
-                    choices,
-                    stud_info,
-                    all_rosters,
-                    parent_sheet,
-                    class_to_planned_writes,
-                )
-            else:
-                continue
-
-            if len(student.classes) > 0:
-                students[student.id] = student
-
-                ne = (r.parent1_first, r.parent1_last, r.parent1_email.lower())
-                for parent in parents.values():
-                    if (
-                        parent.first,
-                        parent.last,
-                        parent.email,
-                    ) == ne:
-                        parent.children.append(student.id)
-                        break
-                else:
-                    parent = r.get_parent1(children=[student.id])
-                    parents[parent.id] = parent
-
-                student.parents.append(parent.id)
-
-                if r.parent2_first.strip() != "":
-                    ne = (r.parent2_first, r.parent2_last, r.parent2_email.lower())
-                    for parent in parents.values():
-                        if (
-                            parent.first,
-                            parent.last,
-                            parent.email,
-                        ) == ne:
-                            parent.children.append(student.id)
-                            break
-                    else:
-                        parent = r.get_parent2(children=[student.id])
-                        parents[parent.id] = parent
-
-                    student.parents.append(parent.id)
-
-            recipients = [r.parent1_email, r.parent2_email]
-
-            length = len(invalid_sheet_info)
-            for code in invalid:
-                for i in range(1, length):
-                    if student.full_name == invalid_sheet_info[i][0]:
-                        if code == invalid_sheet_info[i][3]:
-                            if (
-                                invalid_sheet_info[i][1] in recipients
-                                or invalid_sheet_info[i][2] in recipients
-                            ):
-                                break
-                else:
-                    self.Emailer.send_invalid_code_emails(
-                        recipients,
-                        student.full_name,
-                        code,
-                    )
-
-                    write_info = [
-                        student.full_name,
-                        r.parent1_email,
-                        r.parent2_email,
-                        code,
-                    ]
-
-                    invalid_sheet.write_row(write_info, length)
-                    invalid_sheet_info.append(tuple(write_info))
-                    length += 1
-
-            length = len(full_class_sheet_info)
-            for code in unaccepted:
-                for i in range(1, length):
-                    if student.full_name == full_class_sheet_info[i][0]:
-                        if code == full_class_sheet_info[i][3]:
-                            if (
-                                full_class_sheet_info[i][1] in recipients
-                                or full_class_sheet_info[i][2] in recipients
-                            ):
-                                break
-                else:
-                    self.Emailer.send_class_full_emails(
-                        recipients,
-                        student.full_name,
-                        code,
-                    )
-
-                    write_info = [
-                        student.full_name,
-                        r.parent1_email,
-                        r.parent2_email,
-                        code,
-                    ]
-
-                    full_class_sheet.write_row(write_info, length)
-                    full_class_sheet_info.append(tuple(write_info))
-                    length += 1
-
-        return students, parents
-
-    def place_student(
-        self,
-        student: Student,
-        choices: list,
-        stud_info,
-        all_rosters: SheetBatchGet,
-        parent_sheet: Sheet,
-        offset_dict: dict,
-    ):
-        """
-        DOES NOT ACTUALLY WRITE STUDENTS
-        """
-        unaccepted = []
-        invalid = []
-        found = False
-
-        # this is a readonly operation, so
-        # it's ok to use SheetLike objects instead
-        # of many Sheet objects
-        main_sheet = SheetLike(all_rosters.sheet_data["Classes"])
-        for code in choices:
-            if code.strip() == "":
-                continue
-
-            for c in student.classes:
-                if code[:4] == c[:4]:
-                    break
-            else:
-                try:
-                    roster = SheetLike(all_rosters.sheet_data[code])
-                except KeyError:
-                    invalid.append(code)
-                    continue
-
-                roster_names = list(
-                    zip(
-                        roster.get_column(1),
-                        roster.get_column(2),
-                        roster.get_column(3),
-                        roster.get_column(6),
-                    )
-                )
-
-                # find (or don't find) the student on the existing sheet
-                for i in range(1, len(roster_names)):
-                    if not found:
-                        if stud_info[:2] == roster_names[i][1:3]:
-                            index = parent_sheet.get_column(0).index(roster_names[i][3])
-                            try:
-                                if stud_info[2:4] == tuple(
-                                    parent_sheet.get_row(index)[1:3]
-                                ):
-                                    student.id = roster_names[i][0]
-                                    found = True
-                            except IndexError:
-                                continue
-
-                class_cap = int(
-                    main_sheet.get_column(8)[main_sheet.get_column(0).index(code)]
-                )
-                if len(roster_names) - 1 + offset_dict[code] < class_cap and not found:
-                    # if the student isn't on the sheet (not found) and there
-                    # is an open space in the class
-                    student.classes.append(code)
-                    offset_dict[code] += 1
-                elif (
-                    len(roster_names) - 1 + offset_dict[code] >= class_cap and not found
-                ):
-                    # student isn't on the sheet, but there isn't an open slot in
-                    # the class
-                    unaccepted.append(code)
-                elif found:
-                    # the student is already on the sheet. It doesn't matter if there
-                    # is available space or isn't. Just make it so that the student
-                    # is on there.
-                    student.classes.append(code)
-
-        return student, unaccepted, invalid
-
-
-class ClassRosterSheet(Sheet):
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        scopes: list,
-        path_to_credentials: str,
-        first_time_setup: bool = False,
-    ):
-        """
-        Initializes a ClassRosterSheet object
-        Args:
-            id (str): the long alphanumerical found in the Google Sheets URL
-                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
-            name (str): the name of the sheet (the little tabs at the bottom)
-                inside your spreadsheet you want to access. For example, if you have
-                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
-                specify which one you want to access. Ex: 'Email'
-            scopes (list): a list of a link to the authorization that you want to
-                give this SheetAccessor. You can find all scopes at
-                https://developers.google.com/identity/protocols/oauth2/scopes.
-                If you just want it to be able to read, use
-                https://www.googleapis.com/auth/spreadsheets.readonly.
-            path_to_credentials (str): the relative path towards the credentials.json
-                file
-            first_time_setup (bool): whether or not this is the first time initializing
-                a ClassRosterSheet. If it is, don't do any writing or emailing.
-                This is because Enoch's __init__ method will update the
-                ClassRosterSheet soon. This will not only save time loading cogs
-                but also prevent invalid code emails that happened because the
-                classes hadn't been written yet.
-        """
-        super().__init__(id, name, scopes, path_to_credentials)
-
-        if not first_time_setup:
-            # the below aren't used in self.write_classes,
-            # so they aren't essential and will not be done
-            # on first_time_setup
-            self.StudRegSheet = StudentRegistrationSheet(
-                StudResponses.SHEET_ID,
-                StudResponses.SHEET_NAME,
-                StudResponses.SCOPES,
-                StudResponses.PATH_TO_CREDS,
-            )
-            self.students = self.StudRegSheet.students
-            self.parents = self.StudRegSheet.parents
-
-        # the below methods are independent of a StudentRegistrationSheet
-        # and are used in self.write_classes, so they are essential
-        # even on first_time_setup
-        self.teachers = self.get_teachers()  # dict(uuid: Teacher)
-        self.classes = self.get_classes()
-
-        if not first_time_setup:
-            self.write_parents()
-
-    def write_classes(self) -> None:
-        """
-        A method designed to write class/teacher data
-        from the Teacher Data sheet to the Class Roster
-        sheet.
-        This is called in __init__.py after instantiating
-        a new ClassRosterSheet
-        """
-        reader = Sheet(
-            TeacherData.SHEET_ID,
-            TeacherData.SHEET_NAME,
-            TeacherData.SCOPES,
-            TeacherData.PATH_TO_CREDS,
-        )
-        class_writer = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Classes",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-        teacher_writer = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Teachers",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-        # ignore the first row in all these cases
-        # since the first row is just labels like "class code" or "teacher name"
-        all_classes = reader.get_column(0)[1:]
-        all_classes = [cls.strip() for cls in all_classes if cls is not None]
-        # might not be necessary strip
-        all_teach1_data = list(
-            zip(
-                reader.get_column(1)[1:],
-                reader.get_column(3)[1:],
-                reader.get_column(4)[1:],
-            )
-        )
-        all_teach1_data = [
-            (i[0].strip(), i[1].strip(), i[2].strip()) for i in all_teach1_data
-        ]
-        all_teach2_data = list(
-            zip(
-                reader.get_column(2)[1:],
-                reader.get_column(5)[1:],
-                reader.get_column(6)[1:],
-            )
-        )
-        all_teach2_data = [
-            (i[0].strip(), i[1].strip(), i[2].strip()) for i in all_teach2_data
-        ]
-        all_caps = reader.get_column(7)[1:]
-
-        # NOTE
-        # THIS DOES NOT UPDATE PRE-WRITTEN CLASSES
-        # THIS IS THE PART THAT ONLY ADDS NEW CLASSES
-        # (ie if the class 11111 was already on the sheet and then a new
-        # teacher was added, nothing would change on the master sheet)
-        unwritten_classes = set(all_classes).difference(self.classes)
-        cur_teachers = []
-        new_teachers = []
-        code_writing_data = []
-        teach_writing_data = []
-        for cls in unwritten_classes:
-            idx = all_classes.index(cls)
-
-            # decide if teachers are new or already existing
-            if all_teach1_data[idx] != tuple([""] * 3) and self.isNewTeacher(
-                *all_teach1_data[idx]
-            ):
-                name_split = all_teach1_data[idx][0].split(" ")
-                first, last = (" ".join(name_split[0:-1]), name_split[-1])
-                temp_teach = Teacher(
-                    first, last, all_teach1_data[idx][1], all_teach1_data[idx][2]
-                )
-                self.teachers[temp_teach.id] = temp_teach
-                cur_teachers.append(temp_teach)
-                new_teachers.append(temp_teach)
-            else:
-                cur_teachers.append(self.getMatchingTeacher(*all_teach1_data[idx]))
-            if all_teach2_data[idx] != tuple([""] * 3) and self.isNewTeacher(
-                *all_teach2_data[idx]
-            ):
-                name_split = all_teach2_data[idx][0].split(" ")
-                first, last = (" ".join(name_split[0:-1]), name_split[-1])
-                temp_teach = Teacher(
-                    first, last, all_teach2_data[idx][1], all_teach2_data[idx][2]
-                )
-                self.teachers[temp_teach.id] = temp_teach
-                cur_teachers.append(temp_teach)
-                new_teachers.append(temp_teach)
-            else:
-                cur_teachers.append(self.getMatchingTeacher(*all_teach2_data[idx]))
-
-            # get stuff to write
-            course_type = Codes.COURSES[cls[0]]
-            course_level = Codes.LEVELS[cls[1]]
-            course_days = Codes.DAYS[cls[2]]
-            course_times = Codes.TIMES[cls[3]]
-            teach1_uuid, teach2_uuid = "", ""
-            teach1_uuid = cur_teachers[0].id
-            if cur_teachers[1] is not None:
-                teach2_uuid = cur_teachers[1].id
-
-            # add the content to the content to write
-            code_writing_data.append(
-                [
-                    cls,  # class code
-                    course_type,  # ie "java", "python", etc
-                    course_level,
-                    course_days,
-                    course_times,
-                    teach1_uuid,
-                    teach2_uuid,
-                    "",  # "meeting location" - not given
-                    all_caps[idx],
-                ]
-            )
-
-            # if new teacher(s) was/were added, update teacher sheet
-            # since the for loop won't execute if len(new_teachers)==0
-            for i in range(len(new_teachers)):
-                teach_writing_data.append(
-                    [
-                        new_teachers[i].id,
-                        new_teachers[i].first,
-                        new_teachers[i].last,
-                        new_teachers[i].email,
-                        new_teachers[i].phone,
-                    ],
-                )
-
-            # reset lists for next iter
-            new_teachers = []
-            cur_teachers = []
-
-        info = class_writer.sheet.get(
-            spreadsheetId=StudTeachSheet.SHEET_ID,
-            ranges=["Classes", "Teachers"],
-            includeGridData=False,
-        ).execute()
-
-        self.batchWrite(
-            code_writing_data,
-            info["sheets"][0]["properties"]["sheetId"],
-            class_writer,
-            StudTeachSheet.SHEET_ID,
-        )
-        self.batchWrite(
-            teach_writing_data,
-            info["sheets"][1]["properties"]["sheetId"],
-            teacher_writer,
-            StudTeachSheet.SHEET_ID,
-        )
-        # use batchUpdate to add new (sub)sheets for each new
-        # class code
-        self.add_sheets(unwritten_classes, all_classes, all_caps, class_writer)
-
-    def batchWrite(
-        self,
-        writing_data: list,
-        subsheet_id: int,
-        writer: Sheet,
-        spreadsheetId: str,
-    ):
-        batch_write_request = {
-            "requests": [
-                {
-                    "appendCells": {
-                        "sheetId": subsheet_id,
-                        "rows": [
-                            {
-                                "values": [
-                                    {"userEnteredValue": {"stringValue": str(column)}}
-                                    for column in row
-                                ]
-                            }
-                            for row in writing_data
-                        ],
-                        "fields": "userEnteredValue",
-                    }
-                }
-            ]
-        }
-        writer.sheet.batchUpdate(
-            spreadsheetId=spreadsheetId, body=batch_write_request
-        ).execute()
-
-    def add_sheets(
-        self,
-        unwritten_classes: set,
-        all_classes: list,
-        all_caps: list,
-        class_writer: Sheet,
-    ) -> None:
-        """
-        Method to create new sheets.
-        Errors out w/ HTTP Error if the requested sheets already exist.
-        Also, creates the formatted header for the sheet
-        """
-        if len(unwritten_classes) == 0:
-            # don't bother making requests if there are none to be made
-            return
-        add_requests = {
-            "requests": [
-                {
-                    "addSheet": {
-                        "properties": {
-                            "title": all_classes[all_classes.index(cls)],
-                            # this sheetId refers merely to an id for the sheet
-                            "sheetId": all_classes[all_classes.index(cls)],
-                            "gridProperties": {
-                                "rowCount": int(all_caps[all_classes.index(cls)]) + 1,
-                                "columnCount": 26,
-                            },
-                        }
-                    }
-                }
-                for cls in unwritten_classes
-            ]
-        }
-        class_writer.sheet.batchUpdate(
-            spreadsheetId=StudTeachSheet.SHEET_ID, body=add_requests
-        ).execute()
-
-        # make headers for each new sheet
-        data = [
-            "#",
-            "UUID",
-            "First Name",
-            "Last Name",
-            "Email",
-            "Note",
-            "Parent 1 UUID",
-            "Parent 2 UUID",
-        ]
-        header_requests = {
-            "requests": [
-                {
-                    "updateCells": {
-                        "start": {
-                            "sheetId": all_classes[all_classes.index(cls)],
-                            "rowIndex": 0,
-                            "columnIndex": 0,
-                        },
-                        "rows": [
-                            {
-                                "values": [
-                                    {"userEnteredValue": {"stringValue": str(thing)}}
-                                    for thing in data
-                                ]
-                            }
-                        ],
-                        "fields": "userEnteredValue",
-                    }
-                }
-                for cls in unwritten_classes
-            ]
-        }
-        class_writer.sheet.batchUpdate(
-            spreadsheetId=StudTeachSheet.SHEET_ID, body=header_requests
-        ).execute()
-
-        # format the new headers (green bg, bold black text)
-        format_requests = {
-            "requests": [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": all_classes[all_classes.index(cls)],
-                            "startRowIndex": 0,
-                            "endRowIndex": 1,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 8,
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                # rgb(52, 245, 197)
-                                "backgroundColor": {
-                                    "red": 52 / 255,
-                                    "green": 245 / 255,
-                                    "blue": 197 / 255,
-                                },
-                                "horizontalAlignment": "LEFT",
-                                "textFormat": {
-                                    "foregroundColor": {
-                                        "red": 0.0,
-                                        "green": 0.0,
-                                        "blue": 0.0,
-                                    },
-                                    "bold": True,
-                                },
-                            }
-                        },
-                        "fields": str(
-                            "userEnteredFormat(backgroundColor,textFormat,"
-                            + "horizontalAlignment)"
-                        ),
-                    }
-                }
-                for cls in unwritten_classes
-            ]
-        }
-        class_writer.sheet.batchUpdate(
-            spreadsheetId=StudTeachSheet.SHEET_ID, body=format_requests
-        ).execute()
-
-        print("created new subsheets for the following class codes", unwritten_classes)
-
-    def isNewTeacher(self, full_name: str, email: str, phone: str) -> bool:
-        for teacher in self.teachers.values():
-            if (
-                teacher.full_name.lower() == full_name.lower()
-                and teacher.email == email
-                and teacher.phone == phone
-            ):
-                # old teacher if the full name, email, phone match
-                return False
-        return True  # new teacher if none of the (names, emails, phones) matched
-
-    def getMatchingTeacher(
-        self, full_name: str, email: str, phone: str
-    ) -> Union[Teacher, None]:
-        for teacher in self.teachers.values():
-            if (
-                teacher.full_name.lower() == full_name.lower()
-                and teacher.email == email
-                and teacher.phone == phone
-            ):
-                return teacher
-        return None
-
-    def write_placements(self):
-        all_data = SheetBatchGet(StudTeachSheet.SHEET_ID)
-        all_rosters = {
-            code: SheetLike(all_data.sheet_data[code]) for code in all_data.sheet_data
-        }
-        writer = Sheet(
-            StudTeachSheet.SHEET_ID,
-            StudTeachSheet.SHEET_NAME,
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        for student in self.students.values():
-            for code in student.classes:
-                if student.id not in self.classes[code].students:
-                    """roster = Sheet(
-                        StudTeachSheet.SHEET_ID,
-                        code,
-                        StudTeachSheet.SCOPES,
-                        StudTeachSheet.PATH_TO_CREDS,
-                    )"""
-                    roster = all_rosters[code]
-
-                    stud_info = [
-                        0,
-                        student.id,
-                        student.first,
-                        student.last,
-                        student.email,
-                        student.note,
-                        student.parents[0],
-                    ]
-
-                    if len(student.parents) == 2:
-                        stud_info.append(student.parents[1])
-
-                    self.classes[code].students.append(student.id)
-
-                    uuids = roster.get_column(1)
-                    for i in range(1, len(uuids)):
-                        stud_info[0] = i
-                        if uuids[i] is None:
-                            roster.simulate_write_row(stud_info, i)
-                            writer_roster = Sheet(
-                                StudTeachSheet.SHEET_ID,
-                                code,
-                                StudTeachSheet.SCOPES,
-                                StudTeachSheet.PATH_TO_CREDS,
-                            )
-                            writer_roster.write_row(stud_info, i)
-                            break
-                    else:
-                        i = len(self.classes[code].students)
-                        stud_info[0] = i
-                        roster.simulate_write_row(stud_info, i)
-                        writer.prepare_batch_write_row(stud_info, code)
-
-                    recipients = []
-                    for p_id in student.parents:
-                        recipients.append(self.parents[p_id].email)
-
-                    self.StudRegSheet.Emailer.send_welcome_emails(
-                        recipients,
-                        student.full_name,
-                        code,
-                    )
-
-        # if the batch is empty, just don't bother with it
-        if len(writer.batch_write_request["requests"]) != 0:
-            writer.run_batch_update()
-
-    def write_parents(self):
-        roster = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Parents",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-        uuids = roster.get_column(0)
-        length = len(uuids)
-
-        for parent in self.parents.values():
-            if parent.id not in uuids:
-                parent_info = [
-                    parent.id,
-                    parent.first,
-                    parent.last,
-                    parent.email,
-                ]
-
-                roster.write_row(parent_info, length)
-                length += 1
-
-    def get_teachers(self):
-        teachers = {}
-        teacher_list = Sheet(
-            StudTeachSheet.SHEET_ID,
-            "Teachers",
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        for i in range(1, len(teacher_list.get_column(0))):
-            row = teacher_list.get_row(i)
-
-            if len(row) < 5:
-                continue
-
-            teachers[row[0]] = Teacher(row[1], row[2], row[3], row[4], [])
-            teachers[row[0]].id = row[0]
-
-        return teachers
-
-    def get_classes(self):
-        classes = {}
-
-        # only make 1 read request instead of making
-        # many individual requests
-        all_rosters = SheetBatchGet(
-            StudTeachSheet.SHEET_ID,
-            self.get_column(0)[1:],
-            StudTeachSheet.SCOPES,
-            StudTeachSheet.PATH_TO_CREDS,
-        )
-
-        for i in range(1, len(self.get_column(0))):
-            row = self.get_row(i)
-
-            if len(row) < 9 or row[0] == "":
-                continue
-
-            code = row[0]
-            classes[code] = Class(code, row[7], [row[5]], [], int(row[8]))
-            self.teachers[row[5]].classes.append(code)
-
-            if row[6].strip() != "":
-                classes[code].teachers.append(row[6])
-                self.teachers[row[6]].classes.append(code)
-
-            # READONLY roster
-            roster = SheetLike(all_rosters.sheet_data[code])
-
-            for i in range(1, len(roster.get_column(1))):
-                classes[code].students.append(roster.get_column(1)[i])
-
-        return classes
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dotenv import load_dotenv
+from sheets._class import Class
+from sheets.emails import Emails
+from sheets.people import Parent, Student, Teacher
+from cft.cft import StudTeachSheet, StudResponses, Email, Codes, TeacherData
+from sheets.backoff import execute_with_backoff
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+from typing import Union
+
+# process-wide auth state: the token.pickle check runs once and each
+# scope set gets one cached service, so Sheet objects that don't pass
+# an explicit service= still end up sharing instead of re-authorizing
+_creds = None
+_service_cache = {}
+
+
+def get_service(scopes: list, path_to_credentials: str):
+    """
+    Authorizes against the Sheets API and returns the service object.
+    Credentials and the built service are cached at module level (one
+    service per scope set), so every Sheet in the process shares one
+    authorized HTTPS connection instead of each object redoing the
+    token check, the discovery fetch, and the TLS handshake.
+    Args:
+        scopes (list): a list of a link to the authorization that you want to
+            give this service. See Sheet for details.
+        path_to_credentials (str): the relative path towards the
+            credentials.json file
+    """
+    global _creds
+
+    key = tuple(scopes)
+    if key in _service_cache:
+        return _service_cache[key]
+
+    creds = _creds
+    if creds is None and os.path.exists("token.pickle"):
+        with open("token.pickle", "rb") as token:
+            creds = pickle.load(token)
+    # If there are no (valid) credentials available, let the user log in.
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                path_to_credentials, scopes
+            )
+            creds = flow.run_local_server(port=0)
+        # Save the credentials for the next run
+        with open("token.pickle", "wb") as token:
+            pickle.dump(creds, token)
+    _creds = creds
+
+    # cache_discovery=False skips googleapiclient's file-based
+    # discovery cache (and its noisy oauth2client warning)
+    service = build("sheets", "v4", credentials=creds, cache_discovery=False)
+    _service_cache[key] = service
+    return service
+
+
+# class-code prefix -> (course, level, days, time), precomputed once at
+# import so decoding a code in the write_classes loop is a single dict
+# lookup instead of four digit-indexed tuple lookups
+_CODE_INFO = {
+    f"{a + 1}{b + 1}{c + 1}{d + 1}": (
+        Codes.COURSES[a],
+        Codes.LEVELS[b],
+        Codes.DAYS[c],
+        Codes.TIMES[d],
+    )
+    for a in range(len(Codes.COURSES))
+    for b in range(len(Codes.LEVELS))
+    for c in range(len(Codes.DAYS))
+    for d in range(len(Codes.TIMES))
+}
+
+
+@lru_cache(maxsize=None)
+def _col_letter(index: int) -> str:
+    """
+    Returns the A1-notation column letters (A, B, ... Z, AA, AB, ...)
+    for a 0-based column index. chr(index + 65) arithmetic only works
+    up to column Z; index 26 silently produced '[' and a broken range.
+    """
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class FormResponse:
+    # a registration season creates one of these per form row, so skip
+    # the per-instance __dict__ like the people.py classes already do
+    __slots__ = (
+        "student_first",
+        "student_last",
+        "student_email",
+        "student_note",
+        "parent1_first",
+        "parent1_last",
+        "parent1_email",
+        "parent2_first",
+        "parent2_last",
+        "parent2_email",
+        "choices",
+    )
+
+    def __init__(
+        self,
+        student_first: str,
+        student_last: str,
+        parent1_first: str,
+        parent1_last: str,
+        parent1_email: str,
+        choices: list,
+        student_email: str = None,
+        student_note: str = None,
+        parent2_first: str = None,
+        parent2_last: str = None,
+        parent2_email: str = None,
+    ):
+        """
+        Initializes a FormResponse object, represents an individual
+            registration form submission
+        Args:
+            student_first (str): The first name of the student according
+                to their form response
+            student_last (str): The last name of the student according
+                to their form response
+            student_email (str): The email of the student according
+                to their form response, Default: None
+            student_note (str): The note of the student left during their
+                form submission, Default: None
+            parent1_first (str): The first name of the first parent according
+                to their form response
+            parent1_last (str): The last name of the first parent according
+                to their form response
+            parent1_email (str): The email of the first parent according
+                to their form response
+            parent2_first (str): The first name of the second parent according
+                to their form response, Default: None
+            parent2_last (str): The last name of the second parent according
+                to their form response, Default: None
+            parent2_email (str): The email of the second parent according
+                to their form response, Default: None
+            choices (list): A list of the first choice, second choice, and
+                third choice class codes (class codes are of type int)
+        """
+        self.student_first = student_first
+        self.student_last = student_last
+        self.student_email = student_email
+        self.student_note = student_note
+
+        self.parent1_first = parent1_first
+        self.parent1_last = parent1_last
+        # emails are case-insensitive, so normalize them here once
+        # instead of lower-casing on every dedup comparison downstream
+        self.parent1_email = parent1_email.lower()
+
+        self.parent2_first = parent2_first
+        self.parent2_last = parent2_last
+        self.parent2_email = parent2_email.lower() if parent2_email else parent2_email
+
+        self.choices = choices
+
+    def get_student(self):
+        """
+        Returns a Student object based on the student's first, last,
+            email, and note. DOES NOT PLACE THE STUDENT ANYWHERE.
+        """
+        return (
+            Student(
+                self.student_first,
+                self.student_last,
+                email=self.student_email,
+                note=self.student_note,
+                parents=[],
+                classes=[],
+            ),
+            self.choices,
+        )
+
+    def get_parent1(self, children=None):
+        """
+        Returns a Parent object based on the first parent's first, last,
+            email, and inputted children. Does not place the parent anywhere.
+        """
+        return Parent(
+            self.parent1_first,
+            self.parent1_last,
+            self.parent1_email,
+            children if children is not None else [],
+        )
+
+    def get_parent2(self, children=None):
+        """
+        Returns a Parent object based on the second parent's first, last,
+            email, and inputted children. Does not place the parent anywhere.
+        """
+        return Parent(
+            self.parent2_first,
+            self.parent2_last,
+            self.parent2_email,
+            children if children is not None else [],
+        )
+
+
+class Sheet:
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        scopes: list,
+        path_to_credentials: str,
+        prefetched_values: dict = None,
+        service=None,
+        read_range: str = "A:ZZ",
+    ):
+        """
+        Initializes a Sheet object
+        Args:
+            id (str): the long alphanumerical found in the Google Sheets URL
+                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
+            name (str): the name of the sheet (the little tabs at the bottom)
+                inside your spreadsheet you want to access. For example, if you have
+                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
+                specify which one you want to access. Ex: 'Email'
+            scopes (list): a list of a link to the authorization that you want to
+                give this SheetAccessor. You can find all scopes at
+                https://developers.google.com/identity/protocols/oauth2/scopes.
+                If you just want it to be able to read, use
+                https://www.googleapis.com/auth/spreadsheets.readonly.
+            path_to_credentials (str): the relative path towards the credentials.json
+                file
+            prefetched_values (dict): a raw valueRange payload (like what a single
+                get request or one entry of a batchGet's valueRanges returns) for
+                this sheet. If provided, no read request is made and the payload
+                is used as this sheet's data instead. Use this to share one
+                batchGet between several Sheet objects.
+            service: an already authorized Sheets API service object (what
+                get_service returns). If provided, it is reused instead of
+                authorizing and opening a new connection for this object.
+            read_range (str): the A1 range (without the tab name) to read
+                on construction. The default covers every column but only
+                the rows actually in use; callers that know they only
+                need a few columns can pass something like "A:D" to
+                shrink the payload further.
+        """
+        self.id = id
+        self.name = name
+        self.scopes = scopes
+        self.path_to_credentials = path_to_credentials
+
+        if service is None:
+            service = get_service(scopes, path_to_credentials)
+        self.service = service
+        self.sheet = self.service.spreadsheets()
+
+        if prefetched_values is not None:
+            self.spreadsheet = prefetched_values.get("values", [])
+        else:
+            # an unbounded column range only returns the rows in use,
+            # unlike the old A1:ZZ1000 which padded every fetch out to
+            # 1000 rows; fields="values" strips the payload down to the
+            # cells themselves
+            range_name = self.name + "!" + read_range
+            result = execute_with_backoff(
+                self.sheet.values().get(
+                    spreadsheetId=self.id,
+                    range=range_name,
+                    fields="values",
+                )
+            )
+
+            self.spreadsheet = result.get("values", [])
+
+        # used if ever a prepareBatchWrite is used; _batch_index maps
+        # sheetId -> its queued appendCells request so that queueing a
+        # row never rescans the whole request list
+        self.batch_write_request = {"requests": []}
+        self._batch_index = {}
+
+        # memoized get_column results, cleared whenever self.spreadsheet
+        # is mutated (see simulate_write_row and write_classes)
+        self._column_cache = {}
+
+        # lazily fetched spreadsheet metadata, see get_metadata
+        self._metadata = None
+
+        # queued write_row-style writes, flushed as one values.batchUpdate
+        self.value_write_data = []
+
+    def get_metadata(self):
+        """
+        Returns this spreadsheet's metadata (spreadsheets.get without
+        grid data), fetched at most once per Sheet object. This is
+        where subsheet ids live. Anything that creates or deletes
+        subsheets must reset self._metadata to None (see add_sheets).
+        """
+        if self._metadata is None:
+            self._metadata = execute_with_backoff(
+                self.sheet.get(spreadsheetId=self.id, includeGridData=False)
+            )
+        return self._metadata
+
+    def get_column(self, index: int):
+        """
+        returns a List[str] of each item in the column at the given index position.
+        The list is in order from top to bottom.
+        Args:
+            index (int): position of the column on the spreadsheet. An index of 0
+                indicates the first column on the left.
+        """
+        # callers like get_classes ask for the same column repeatedly,
+        # so memoize per index until the spreadsheet is mutated
+        if index in self._column_cache:
+            return self._column_cache[index]
+
+        # one comprehension with a length check instead of a
+        # try/except IndexError per row
+        result = [row[index] if index < len(row) else None for row in self.spreadsheet]
+
+        # short-circuits on the first real value instead of allocating
+        # a same-length list of Nones and comparing the whole thing
+        if all(cell is None for cell in result):
+            result = None
+
+        self._column_cache[index] = result
+        return result
+
+    def get_row(self, index: int):
+        """
+        returns a List[str] of each item in the row at the given index position.
+        The list is in order from left to right.
+        Args:
+            index (int): position of the row on the spreadsheet. An index of 0
+                indicates the first row at the top.
+        """
+        try:
+            return self.spreadsheet[index]
+        except IndexError:
+            print(f"Index {index} not in range.")
+            return None
+
+    def write_column(self, data: list, index: int):
+        """
+        Writes the given data to a column at the given index position.
+        Each element in the data list occupies one cell in the column.
+        Data is written from top to bottom.
+        Args:
+            data (list): a list of strings that you want to write onto the sheet
+            index (int): position of the column on the spreadsheet. An index of 0
+                indicates the first column on the left.
+        """
+        # one single-cell row per element; list(cell) exploded each
+        # string into its characters, writing one character per column
+        value = {"values": [[cell] for cell in data]}
+        letter = _col_letter(index)
+        range_name = self.name + f"!{letter}1:{letter}{len(data)}"
+
+        try:
+            execute_with_backoff(
+                self.sheet.values().update(
+                    spreadsheetId=self.id,
+                    range=range_name,
+                    valueInputOption="RAW",
+                    body=value,
+                )
+            )
+        except HttpError:
+            execute_with_backoff(
+                self.sheet.values().append(
+                    spreadsheetId=self.id,
+                    range=range_name,
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    body=value,
+                )
+            )
+
+    def write_row(self, data: list, index: int):
+        """
+        Writes the given data to a row at the given index position.
+        Each element in the data list occupies one cell in the row.
+        Data is written from left to right.
+        Args:
+            data (list): a list of strings that you want to write onto the sheet
+            index (int): position of the row on the spreadsheet. An index of 0
+                indicates the first row at the top.
+        """
+        value = {"values": [list(data)]}
+        range_name = (
+            self.name + f"!A{index + 1}:{_col_letter(len(data) - 1)}{index + 1}"
+        )
+
+        try:
+            execute_with_backoff(
+                self.sheet.values().update(
+                    spreadsheetId=self.id,
+                    range=range_name,
+                    valueInputOption="RAW",
+                    body=value,
+                )
+            )
+        except HttpError:
+            execute_with_backoff(
+                self.sheet.values().append(
+                    spreadsheetId=self.id,
+                    range=range_name,
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    body=value,
+                )
+            )
+
+    def prepare_value_write(self, data: list, index: int, sheet_name: str = None):
+        """
+        Queues a write_row-style write instead of sending it right
+        away. Every queued write is sent in one values.batchUpdate by
+        flush_value_writes, so N row writes cost one request against
+        the write quota instead of N.
+        Args:
+            data (list): a list of strings that you want to write onto the sheet
+            index (int): position of the row on the spreadsheet. An index of 0
+                indicates the first row at the top.
+            sheet_name (str): tab to write to, if not the tab this Sheet
+                was built against. One batchUpdate can carry writes for
+                several tabs of the same spreadsheet.
+        """
+        if sheet_name is None:
+            sheet_name = self.name
+        range_name = (
+            sheet_name + f"!A{index + 1}:{_col_letter(len(data) - 1)}{index + 1}"
+        )
+        self.value_write_data.append({"range": range_name, "values": [list(data)]})
+
+    def flush_value_writes(self):
+        """
+        Sends every write queued by prepare_value_write as a single
+        values.batchUpdate. Does nothing if the queue is empty.
+        """
+        if len(self.value_write_data) == 0:
+            return
+
+        execute_with_backoff(
+            self.sheet.values().batchUpdate(
+                spreadsheetId=self.id,
+                body={
+                    "valueInputOption": "RAW",
+                    "data": self.value_write_data,
+                },
+            )
+        )
+        self.value_write_data = []
+
+    def values_append(self, rows: list, sheet_name: str = None):
+        """
+        Appends the given rows after the last data row of a tab via
+        values.append. For plain strings this is lighter than an
+        appendCells batchUpdate: no per-cell userEnteredValue envelopes
+        to build or parse. Does nothing if rows is empty.
+        Args:
+            rows (list): a 2D list of the rows to append
+            sheet_name (str): tab to append to, if not the tab this
+                Sheet was built against
+        """
+        if len(rows) == 0:
+            return
+        if sheet_name is None:
+            sheet_name = self.name
+        execute_with_backoff(
+            self.sheet.values().append(
+                spreadsheetId=self.id,
+                range=sheet_name + "!A1",
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": rows},
+            )
+        )
+
+    def prepare_batch_write_row(self, writing_data: list, code: str):
+        """
+        AS OF NOW, THIS ONLY APPENDS DATA ROWS.
+        If you want to do a more targeted operation,
+        like writing to a specific row, just use
+        write_row
+
+        Arguments:
+            writing_data: list - a 1D list to write
+            code : str - the class code
+        """
+        row = {
+            "values": [
+                {"userEnteredValue": {"stringValue": str(column)}}
+                for column in writing_data
+            ]
+        }
+
+        # _batch_index finds the queued request for this subsheet in one
+        # lookup; the old scan compared int(code) against the stored str
+        # code, so it never matched and every row got its own request
+        request = self._batch_index.get(int(code))
+        if request is not None:
+            request["appendCells"]["rows"].append(row)
+        else:
+            request = {
+                "appendCells": {
+                    "sheetId": int(code),
+                    "rows": [row],
+                    "fields": "userEnteredValue",
+                }
+            }
+            self.batch_write_request["requests"].append(request)
+            self._batch_index[int(code)] = request
+
+    def run_batch_update(self):
+        """
+        runs the prepared batch_write request
+        """
+        execute_with_backoff(
+            self.sheet.batchUpdate(spreadsheetId=self.id, body=self.batch_write_request)
+        )
+        self.batch_write_request = {"requests": []}
+        self._batch_index = {}
+
+
+class ReadOnlyError(Exception):
+    pass
+
+
+class SheetLike(Sheet):
+    """
+    A SheetLike object is an object that works just like a sheet,
+    but is READONLY
+    """
+
+    def __init__(self, sheet_data):
+        """
+        Initializes a SheetLike object. It has all the read methods of a
+        Sheet object, but is READONLY!! Attempting to call write_row or
+        write_column will raise a ReadOnlyError
+        Args
+            sheet_data (dict) : the basic data for the sheet. It should be in
+            the raw form (ie a dictionary with keys like 'range',
+            'values', 'majorDimension'). This is what is returned from a single
+            get request
+        """
+        self.spreadsheet = sheet_data.get("values", [])
+        self._column_cache = {}
+
+        # per-column cursors for first_blank_row_in_col; they only
+        # move forward, so repeated blank-row searches never rescan
+        # rows that have already been filled
+        self._blank_cursors = {}
+
+    def first_blank_row_in_col(self, col_index: int):
+        """
+        Returns the index of the first data row (the header row is
+        skipped) whose cell in the given column is blank, or None if
+        there isn't one. The search resumes from where the previous
+        call stopped, so filling blanks one by one (simulate_write_row
+        and ask again) costs one pass over the sheet in total instead
+        of one pass per placement.
+        """
+        start = self._blank_cursors.get(col_index, 1)
+        for i in range(start, len(self.spreadsheet)):
+            row = self.spreadsheet[i]
+            if col_index >= len(row) or row[col_index] is None:
+                self._blank_cursors[col_index] = i
+                return i
+        self._blank_cursors[col_index] = len(self.spreadsheet)
+        return None
+
+    def write_row(self, data: list, index: int):
+        raise ReadOnlyError
+
+    def simulate_write_row(self, data: list, index: int):
+        """
+        Updtes the simulated sheet's values.
+        DOES NOT UPDATE THE REMOTE SHEET'S VALUES
+        """
+        self._column_cache.clear()
+        lst = []
+        for i in range(len(self.spreadsheet[0])):
+            if i < len(data):
+                lst.append(data[i])
+            else:
+                lst.append(None)  # just in case len(data) != len(self.spreadsheet[0])
+        if index < len(self.spreadsheet):
+            self.spreadsheet[index] = lst
+        else:
+            while len(self.spreadsheet) <= index:
+                self.spreadsheet.append([])
+            self.spreadsheet[index] = lst
+
+    def write_column(self, data: list, index: int):
+        raise ReadOnlyError  # yeah TODO maybe implement
+
+
+class SheetBatchGet:
+    # every column, but only the rows in use; a bounded range like
+    # A1:ZZ1000 made the API pad each tab's payload out to 1000 rows
+    LARGE_RANGE = "A:ZZ"
+    MASTER_SHEET_NAME = "Classes"
+
+    def __init__(
+        self,
+        id: str,
+        names: list = [],
+        scopes: list = ["https://www.googleapis.com/auth/spreadsheets.readonly"],
+        path_to_credentials: str = "./data/credentials.json",
+        service=None,
+        extra_names: list = (),
+    ):
+        """
+        Uses batchGet to create data in self.sheet_data. This is used to get
+        all the data used to instantiate SheetLike objects.
+        When no names are given (the fetch-every-roster mode),
+        extra_names lists additional tabs to piggyback onto the same
+        batchGet, so side tabs don't need their own read requests.
+        """
+        self.id = id
+
+        ranges_provided = len(names) > 0
+        if ranges_provided:
+            # whole-sheet ranges to make sure we get all data
+            self.names = [
+                f"{code}!{SheetBatchGet.LARGE_RANGE}"
+                for code in names
+                if code is not None
+            ]
+        else:
+            self.names = SheetBatchGet.LARGE_RANGE
+        self.scopes = scopes
+        self.path_to_credentials = path_to_credentials
+
+        if service is None:
+            service = get_service(scopes, path_to_credentials)
+        self.service = service
+        self.sheet = self.service.spreadsheets()
+
+        extra_data = None
+        if ranges_provided:
+            result = execute_with_backoff(
+                self.sheet.values().batchGet(
+                    spreadsheetId=self.id,
+                    ranges=self.names,
+                    fields="valueRanges.values",
+                )
+            )
+        else:
+            extra_data = execute_with_backoff(
+                self.sheet.values().get(
+                    spreadsheetId=self.id,
+                    range=SheetBatchGet.MASTER_SHEET_NAME + "!" + self.names,
+                    fields="values",
+                )
+            )
+            all_names = SheetLike(extra_data).get_column(0)[1:]
+            all_names += list(extra_names)
+            self.names = [code + "!" + SheetBatchGet.LARGE_RANGE for code in all_names]
+            result = execute_with_backoff(
+                self.sheet.values().batchGet(
+                    spreadsheetId=self.id,
+                    ranges=self.names,
+                    fields="valueRanges.values",
+                )
+            )
+
+        # all_data contains individual sheet data, which
+        # can be accessed using the readonly SheetLike class
+        # by doing `a = SheetLike((SheetBatchGet object).all_data[code])`
+        all_data = result.get("valueRanges")
+        # removesuffix, not rstrip: rstrip treats its argument as a
+        # character set, so a code ending in A/Z/0/1 etc. got mangled
+        self.sheet_data = {
+            self.names[i].removesuffix("!" + SheetBatchGet.LARGE_RANGE): all_data[i]
+            for i in range(len(self.names))
+        }
+        if extra_data is not None:
+            self.sheet_data["Classes"] = extra_data
+
+
+class StudentRegistrationSheet(Sheet):
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        scopes: list,
+        path_to_credentials: str,
+        service=None,
+    ):
+        """
+        Initializes a StudentRegistrationSheet object
+        Args:
+            id (str): the long alphanumerical found in the Google Sheets URL
+                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
+            name (str): the name of the sheet (the little tabs at the bottom)
+                inside your spreadsheet you want to access. For example, if you have
+                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
+                specify which one you want to access. Ex: 'Email'
+            scopes (list): a list of a link to the authorization that you want to
+                give this SheetAccessor. You can find all scopes at
+                https://developers.google.com/identity/protocols/oauth2/scopes.
+                If you just want it to be able to read, use
+                https://www.googleapis.com/auth/spreadsheets.readonly.
+            path_to_credentials (str): the relative path towards the credentials.json
+                file
+            service: an already authorized Sheets API service object to
+                reuse instead of authorizing a new one. See Sheet
+        """
+        super().__init__(id, name, scopes, path_to_credentials, service=service)
+
+        load_dotenv()
+        self.Emailer = Emails(
+            Email.NOREPLY,
+            os.getenv("NOREPLY_PASSWORD"),
+        )
+
+        # the roster batchGet doesn't depend on the form rows, so start
+        # it in the background and parse the responses while it's in
+        # flight; only the worker touches the network during the overlap
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            all_rosters = executor.submit(
+                SheetBatchGet,
+                StudTeachSheet.SHEET_ID,
+                service=self.service,
+                extra_names=["Invalid Code Emails", "Full Class Emails", "Parents"],
+            )
+
+            self.responses = self.get_form_responses()
+        self.students, self.parents = self.get_students_parents(all_rosters.result())
+
+    def get_form_responses(self):
+        """
+        Returns a List[FormResponse] of ALL student registration form responses.
+        """
+        responses = []
+
+        # iterate the rows directly and feed FormResponse straight from
+        # the stripped row, so each response costs one pass over the row
+        # with no index bookkeeping or intermediate arg list
+        for row in self.spreadsheet[1:]:
+            if len(row) == 0:
+                continue
+
+            # normalize the whole row in one pass instead of calling
+            # .strip() field by field (and twice for the choice codes)
+            row = [cell.strip() for cell in row]
+
+            responses.append(
+                FormResponse(
+                    row[3],
+                    row[4],
+                    row[6],
+                    row[7],
+                    row[8],
+                    [code for code in row[25:27] if code != ""],
+                    row[5],
+                    row[23],
+                    row[9],
+                    row[10],
+                    row[11],
+                )
+            )
+
+        return responses
+
+    def get_students_parents(self, all_rosters: SheetBatchGet):
+        """
+        Returns dict[str:Student] and dict[str:Parent] of ALL unique students
+        and parents who registered for this class series. The keys are those
+        students' and parents' UUID string.
+        Args:
+            all_rosters (SheetBatchGet): the batched fetch of every
+                roster plus the three side tabs, started by __init__ so
+                it overlaps with form-response parsing
+        """
+        students = {}
+        parents = {}
+        # (first, last, lowercased email) -> Parent, kept in step with
+        # parents so matching a response's parent is one dict lookup
+        # instead of a scan over every parent seen so far
+        parents_by_identity = {}
+        seen_students = set()
+
+        # these two still receive writes, so they stay Sheet objects;
+        # the prefetched payloads mean they don't re-read anything
+        invalid_sheet = Sheet(
+            StudTeachSheet.SHEET_ID,
+            "Invalid Code Emails",
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            prefetched_values=all_rosters.sheet_data["Invalid Code Emails"],
+            service=self.service,
+        )
+
+        full_class_sheet = Sheet(
+            StudTeachSheet.SHEET_ID,
+            "Full Class Emails",
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            prefetched_values=all_rosters.sheet_data["Full Class Emails"],
+            service=self.service,
+        )
+
+        invalid_sheet_info = list(
+            zip(
+                invalid_sheet.get_column(0),
+                invalid_sheet.get_column(1),
+                invalid_sheet.get_column(2),
+                invalid_sheet.get_column(3),
+            )
+        )
+
+        full_class_sheet_info = list(
+            zip(
+                full_class_sheet.get_column(0),
+                full_class_sheet.get_column(1),
+                full_class_sheet.get_column(2),
+                full_class_sheet.get_column(3),
+            )
+        )
+
+        # only read in this method, so the batched payload is enough
+        parent_sheet = SheetLike(all_rosters.sheet_data["Parents"])
+
+        # parent uuid -> full sheet row, built once so place_student
+        # does a dict lookup instead of rebuilding the uuid column and
+        # running list.index for every roster row it inspects
+        parent_id_to_row = {row[0]: row for row in parent_sheet.spreadsheet[1:] if row}
+
+        # walk the raw rows directly; get_column/get_row would rebuild
+        # the whole uuid column (and re-check bounds) on every iteration
+        for parent in parent_sheet.spreadsheet[1:]:
+            if len(parent) < 3:
+                continue
+            elif len(parent) == 3:
+                e = ""
+            else:
+                e = parent[3]
+
+            loaded = Parent(
+                parent[1].strip(),
+                parent[2].strip(),
+                e.strip().lower(),
+                [],
+            )
+            loaded.id = parent[0]
+            parents[parent[0]] = loaded
+            parents_by_identity[(loaded.first, loaded.last, loaded.email)] = loaded
+
+        # dedup indexes over the two log tabs: (student, code) -> the
+        # (parent1, parent2) email pairs already recorded for that pair,
+        # so each check is a hash lookup instead of a scan of every row
+        invalid_seen = {}
+        for row in invalid_sheet_info[1:]:
+            invalid_seen.setdefault((row[0], row[3]), []).append((row[1], row[2]))
+
+        full_class_seen = {}
+        for row in full_class_sheet_info[1:]:
+            full_class_seen.setdefault((row[0], row[3]), []).append((row[1], row[2]))
+
+        # readonly views over the batched payloads, built once and
+        # shared by every place_student call; the payloads never mutate
+        # here, so re-wrapping them per response was pure allocation churn
+        roster_views = {
+            code: SheetLike(data) for code, data in all_rosters.sheet_data.items()
+        }
+
+        # code -> class cap, read off the Classes tab once up front;
+        # deriving it per choice meant two full column scans plus a
+        # list.index for every class a response asked about
+        class_caps = {
+            row[0]: int(row[8])
+            for row in roster_views["Classes"].spreadsheet[1:]
+            if len(row) > 8 and row[8]
+        }
+
+        class_to_planned_writes = {code: 0 for code in all_rosters.sheet_data}
+        for r in self.responses:
+            stud_info = (
+                r.student_first,
+                r.student_last,
+                r.parent1_first,
+                r.parent1_last,
+            )
+
+            if stud_info in seen_students:
+                continue
+            seen_students.add(stud_info)
+
+            student, choices = r.get_student()
+            student, unaccepted, invalid = self.place_student(
+                student,
+                choices,
+                stud_info,
+                roster_views,
+                class_caps,
+                parent_id_to_row,
+                class_to_planned_writes,
+            )
+
+            if len(student.classes) > 0:
+                students[student.id] = student
+
+                ne = (r.parent1_first, r.parent1_last, r.parent1_email)
+                parent = parents_by_identity.get(ne)
+                if parent is not None:
+                    parent.children.append(student.id)
+                else:
+                    parent = r.get_parent1(children=[student.id])
+                    parents[parent.id] = parent
+                    parents_by_identity[ne] = parent
+
+                student.parents.append(parent.id)
+
+                if r.parent2_first.strip() != "":
+                    ne = (r.parent2_first, r.parent2_last, r.parent2_email)
+                    parent = parents_by_identity.get(ne)
+                    if parent is not None:
+                        parent.children.append(student.id)
+                    else:
+                        parent = r.get_parent2(children=[student.id])
+                        parents[parent.id] = parent
+                        parents_by_identity[ne] = parent
+
+                    student.parents.append(parent.id)
+
+            recipients = [r.parent1_email, r.parent2_email]
+
+            length = len(invalid_sheet_info)
+            for code in invalid:
+                already_sent = invalid_seen.get((student.full_name, code), [])
+                if any(e1 in recipients or e2 in recipients for e1, e2 in already_sent):
+                    continue
+
+                self.Emailer.send_invalid_code_emails(
+                    recipients,
+                    student.full_name,
+                    code,
+                )
+
+                write_info = [
+                    student.full_name,
+                    r.parent1_email,
+                    r.parent2_email,
+                    code,
+                ]
+
+                invalid_sheet.prepare_value_write(write_info, length)
+                invalid_sheet_info.append(tuple(write_info))
+                invalid_seen.setdefault((student.full_name, code), []).append(
+                    (r.parent1_email, r.parent2_email)
+                )
+                length += 1
+
+            length = len(full_class_sheet_info)
+            for code in unaccepted:
+                already_sent = full_class_seen.get((student.full_name, code), [])
+                if any(e1 in recipients or e2 in recipients for e1, e2 in already_sent):
+                    continue
+
+                self.Emailer.send_class_full_emails(
+                    recipients,
+                    student.full_name,
+                    code,
+                )
+
+                write_info = [
+                    student.full_name,
+                    r.parent1_email,
+                    r.parent2_email,
+                    code,
+                ]
+
+                full_class_sheet.prepare_value_write(write_info, length)
+                full_class_sheet_info.append(tuple(write_info))
+                full_class_seen.setdefault((student.full_name, code), []).append(
+                    (r.parent1_email, r.parent2_email)
+                )
+                length += 1
+
+        # the dedup above runs against the in-memory *_info lists, so
+        # the queued rows can be flushed as one batchUpdate per tab
+        # instead of one write request per new row
+        invalid_sheet.flush_value_writes()
+        full_class_sheet.flush_value_writes()
+
+        return students, parents
+
+    def place_student(
+        self,
+        student: Student,
+        choices: list,
+        stud_info,
+        roster_views: dict,
+        class_caps: dict,
+        parent_id_to_row: dict,
+        offset_dict: dict,
+    ):
+        """
+        DOES NOT ACTUALLY WRITE STUDENTS
+        Args:
+            roster_views (dict): code mapped to the shared readonly
+                SheetLike view of that roster (see get_students_parents)
+            class_caps (dict): code mapped to that class's cap, read off
+                the Classes tab once by get_students_parents
+            parent_id_to_row (dict): parent uuid mapped to that
+                parent's full row on the Parents tab
+        """
+        unaccepted = []
+        invalid = []
+        found = False
+
+        # this is a readonly operation, so the shared SheetLike views
+        # are enough; nothing here needs its own Sheet object
+        for code in choices:
+            if code.strip() == "":
+                continue
+
+            for c in student.classes:
+                if code[:4] == c[:4]:
+                    break
+            else:
+                roster = roster_views.get(code)
+                if roster is None:
+                    invalid.append(code)
+                    continue
+
+                # read the roster rows directly; the old zip of four
+                # get_column calls made four full passes over the sheet
+                # per choice just to regroup the same cells
+                roster_rows = roster.spreadsheet[1:]
+
+                # find (or don't find) the student on the existing sheet
+                for row in roster_rows:
+                    if found:
+                        break
+                    if len(row) < 7:
+                        continue
+                    if stud_info[:2] == (row[2], row[3]):
+                        parent_row = parent_id_to_row.get(row[6])
+                        if parent_row is None:
+                            continue
+                        if stud_info[2:4] == tuple(parent_row[1:3]):
+                            student.id = row[1]
+                            found = True
+
+                taken = len(roster_rows) + offset_dict[code]
+                class_cap = class_caps[code]
+                if taken < class_cap and not found:
+                    # if the student isn't on the sheet (not found) and there
+                    # is an open space in the class
+                    student.classes.append(code)
+                    offset_dict[code] += 1
+                elif taken >= class_cap and not found:
+                    # student isn't on the sheet, but there isn't an open slot in
+                    # the class
+                    unaccepted.append(code)
+                elif found:
+                    # the student is already on the sheet. It doesn't matter if there
+                    # is available space or isn't. Just make it so that the student
+                    # is on there.
+                    student.classes.append(code)
+
+        return student, unaccepted, invalid
+
+
+class ClassRosterSheet(Sheet):
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        scopes: list,
+        path_to_credentials: str,
+        first_time_setup: bool = False,
+        prefetched_values: dict = None,
+        service=None,
+    ):
+        """
+        Initializes a ClassRosterSheet object
+        Args:
+            id (str): the long alphanumerical found in the Google Sheets URL
+                in between 'docs.google.com/spreadsheets/d/' and '/edit...'
+            name (str): the name of the sheet (the little tabs at the bottom)
+                inside your spreadsheet you want to access. For example, if you have
+                an 'Email' and a 'Parent' subsheet inside your sheet, you need to
+                specify which one you want to access. Ex: 'Email'
+            scopes (list): a list of a link to the authorization that you want to
+                give this SheetAccessor. You can find all scopes at
+                https://developers.google.com/identity/protocols/oauth2/scopes.
+                If you just want it to be able to read, use
+                https://www.googleapis.com/auth/spreadsheets.readonly.
+            path_to_credentials (str): the relative path towards the credentials.json
+                file
+            first_time_setup (bool): whether or not this is the first time initializing
+                a ClassRosterSheet. If it is, don't do any writing or emailing.
+                This is because Enoch's __init__ method will update the
+                ClassRosterSheet soon. This will not only save time loading cogs
+                but also prevent invalid code emails that happened because the
+                classes hadn't been written yet.
+            prefetched_values (dict): a raw valueRange payload for this sheet.
+                If provided, the initial read request is skipped. See Sheet
+            service: an already authorized Sheets API service object to
+                reuse instead of authorizing a new one. See Sheet
+        """
+        super().__init__(
+            id,
+            name,
+            scopes,
+            path_to_credentials,
+            prefetched_values=prefetched_values,
+            service=service,
+        )
+
+        if not first_time_setup:
+            # the below aren't used in self.write_classes,
+            # so they aren't essential and will not be done
+            # on first_time_setup
+            self.StudRegSheet = StudentRegistrationSheet(
+                StudResponses.SHEET_ID,
+                StudResponses.SHEET_NAME,
+                StudResponses.SCOPES,
+                StudResponses.PATH_TO_CREDS,
+                service=self.service,
+            )
+            self.students = self.StudRegSheet.students
+            self.parents = self.StudRegSheet.parents
+
+        # the below methods are independent of a StudentRegistrationSheet
+        # and are used in self.write_classes, so they are essential
+        # even on first_time_setup
+        self.teachers = self.get_teachers()  # dict(uuid: Teacher)
+        # (lowercased full name, email, phone) -> Teacher, so matching
+        # a row from the Teacher Data sheet is one dict lookup instead
+        # of a scan over every known teacher
+        self._teacher_index = {
+            (t.full_name.lower(), t.email, t.phone): t for t in self.teachers.values()
+        }
+        self.classes = self.get_classes()
+
+        if not first_time_setup:
+            self.write_parents()
+
+    @classmethod
+    def from_batch(
+        cls,
+        id: str,
+        names: list,
+        scopes: list,
+        path_to_credentials: str,
+        service=None,
+    ):
+        """
+        Fetches the data for every tab in names with a single
+        values.batchGet instead of one get request per Sheet object.
+        Returns a dict of tab name to raw valueRange payload, which
+        can be handed to __init__ via prefetched_values= so that
+        several sheets share the one read request.
+        Args:
+            id (str): the spreadsheet id (see __init__)
+            names (list): the names of the tabs to fetch
+            scopes (list): see __init__
+            path_to_credentials (str): see __init__
+            service: an already authorized service object to reuse. See Sheet
+        """
+        batch = SheetBatchGet(id, names, scopes, path_to_credentials, service=service)
+        return batch.sheet_data
+
+    def write_classes(self, reader: Sheet = None) -> None:
+        """
+        A method designed to write class/teacher data
+        from the Teacher Data sheet to the Class Roster
+        sheet.
+        This is called in __init__.py after instantiating
+        a new ClassRosterSheet
+        Args:
+            reader (Sheet): an already fetched Teacher Data sheet. The
+                fetch doesn't depend on anything this object reads, so
+                the caller can kick it off concurrently (on a worker
+                thread) while this object is being constructed.
+        """
+        if reader is None:
+            reader = Sheet(
+                TeacherData.SHEET_ID,
+                TeacherData.SHEET_NAME,
+                TeacherData.SCOPES,
+                TeacherData.PATH_TO_CREDS,
+                service=self.service,
+            )
+        # no separate class_writer/teacher_writer Sheets: self already
+        # holds an authorized handle on this spreadsheet, and every
+        # write below goes through batchUpdate, which targets subsheets
+        # by sheetId rather than by the tab a Sheet was built against
+        # ignore the first row in all these cases
+        # since the first row is just labels like "class code" or "teacher name"
+        # one pass over the fetched rows instead of eight get_column
+        # calls that each re-walked the whole matrix to slice a column
+        all_classes = []
+        all_teach1_data = []
+        all_teach2_data = []
+        all_caps = []
+        for row in reader.spreadsheet[1:]:
+            if len(row) == 0:
+                continue
+            if len(row) < 8:
+                row = row + [""] * (8 - len(row))
+            all_classes.append(row[0].strip())
+            all_teach1_data.append((row[1].strip(), row[3].strip(), row[4].strip()))
+            all_teach2_data.append((row[2].strip(), row[5].strip(), row[6].strip()))
+            all_caps.append(row[7])
+
+        # NOTE
+        # THIS DOES NOT UPDATE PRE-WRITTEN CLASSES
+        # THIS IS THE PART THAT ONLY ADDS NEW CLASSES
+        # (ie if the class 11111 was already on the sheet and then a new
+        # teacher was added, nothing would change on the master sheet)
+        unwritten_classes = set(all_classes).difference(self.classes)
+        if len(unwritten_classes) == 0:
+            # the usual restart case: everything is already written, so
+            # skip the metadata fetch and the write machinery entirely
+            return
+
+        # code -> row position, so the loops below don't pay a linear
+        # all_classes.index scan per class (or three, in add_sheets)
+        class_idx = {c: i for i, c in enumerate(all_classes)}
+        cur_teachers = []
+        code_writing_data = []
+        teach_writing_data = []
+        # ids already queued for the Teachers tab, so the same teacher
+        # can never be emitted twice however the loop below evolves
+        written_teacher_ids = set()
+        for cls in unwritten_classes:
+            idx = class_idx[cls]
+
+            # decide if teachers are new or already existing; one index
+            # lookup answers both "is this teacher new?" and "which
+            # existing teacher is this?"
+            teach1 = self.getMatchingTeacher(*all_teach1_data[idx])
+            if all_teach1_data[idx] != tuple([""] * 3) and teach1 is None:
+                name_split = all_teach1_data[idx][0].split(" ")
+                first, last = (" ".join(name_split[0:-1]), name_split[-1])
+                temp_teach = Teacher(
+                    first, last, all_teach1_data[idx][1], all_teach1_data[idx][2]
+                )
+                self.add_teacher(temp_teach)
+                cur_teachers.append(temp_teach)
+                # queue the teacher-sheet row right where the teacher
+                # is created instead of draining a side list later
+                if temp_teach.id not in written_teacher_ids:
+                    teach_writing_data.append(
+                        [
+                            temp_teach.id,
+                            temp_teach.first,
+                            temp_teach.last,
+                            temp_teach.email,
+                            temp_teach.phone,
+                        ],
+                    )
+                    written_teacher_ids.add(temp_teach.id)
+            else:
+                cur_teachers.append(teach1)
+            teach2 = self.getMatchingTeacher(*all_teach2_data[idx])
+            if all_teach2_data[idx] != tuple([""] * 3) and teach2 is None:
+                name_split = all_teach2_data[idx][0].split(" ")
+                first, last = (" ".join(name_split[0:-1]), name_split[-1])
+                temp_teach = Teacher(
+                    first, last, all_teach2_data[idx][1], all_teach2_data[idx][2]
+                )
+                self.add_teacher(temp_teach)
+                cur_teachers.append(temp_teach)
+                if temp_teach.id not in written_teacher_ids:
+                    teach_writing_data.append(
+                        [
+                            temp_teach.id,
+                            temp_teach.first,
+                            temp_teach.last,
+                            temp_teach.email,
+                            temp_teach.phone,
+                        ],
+                    )
+                    written_teacher_ids.add(temp_teach.id)
+            else:
+                cur_teachers.append(teach2)
+
+            # get stuff to write
+            course_type, course_level, course_days, course_times = _CODE_INFO[cls[:4]]
+            teach1_uuid, teach2_uuid = "", ""
+            teach1_uuid = cur_teachers[0].id
+            if cur_teachers[1] is not None:
+                teach2_uuid = cur_teachers[1].id
+
+            # add the content to the content to write
+            code_writing_data.append(
+                [
+                    cls,  # class code
+                    course_type,  # ie "java", "python", etc
+                    course_level,
+                    course_days,
+                    course_times,
+                    teach1_uuid,
+                    teach2_uuid,
+                    "",  # "meeting location" - not given
+                    all_caps[idx],
+                ]
+            )
+
+            # reset for next iter
+            cur_teachers = []
+
+        # cached on this Sheet object, so other callers needing a
+        # subsheet id don't refetch; keyed by title since the full
+        # metadata lists every tab, not just these two
+        sheet_ids = {
+            s["properties"]["title"]: s["properties"]["sheetId"]
+            for s in self.get_metadata()["sheets"]
+        }
+
+        self.batchWrite(
+            code_writing_data,
+            sheet_ids["Classes"],
+            self,
+            StudTeachSheet.SHEET_ID,
+        )
+        # plain ids/names/emails carry no formatting, so the teacher
+        # rows can skip the appendCells envelope entirely
+        self.values_append(teach_writing_data, sheet_name="Teachers")
+        # use batchUpdate to add new (sub)sheets for each new
+        # class code
+        self.add_sheets(unwritten_classes, class_idx, all_caps, self)
+
+        # keep the local copy of the sheet current so that the
+        # placement pass can be built from prefetched_values=
+        # without re-reading the whole tab
+        for row in code_writing_data:
+            self.spreadsheet.append([str(column) for column in row])
+        self._column_cache.clear()
+
+    # max appendCells rows per batchUpdate; a single giant payload can
+    # time out or draw 500s, so big writes are split at this size
+    BATCH_SIZE = int(os.getenv("SHEETS_BATCH_SIZE", "500"))
+
+    def batchWrite(
+        self,
+        writing_data: list,
+        subsheet_id: int,
+        writer: Sheet,
+        spreadsheetId: str,
+    ):
+        for start in range(0, len(writing_data), ClassRosterSheet.BATCH_SIZE):
+            chunk = writing_data[start : start + ClassRosterSheet.BATCH_SIZE]
+            batch_write_request = {
+                "requests": [
+                    {
+                        "appendCells": {
+                            "sheetId": subsheet_id,
+                            "rows": [
+                                {
+                                    "values": [
+                                        {
+                                            "userEnteredValue": {
+                                                "stringValue": str(column)
+                                            }
+                                        }
+                                        for column in row
+                                    ]
+                                }
+                                for row in chunk
+                            ],
+                            "fields": "userEnteredValue",
+                        }
+                    }
+                ]
+            }
+            execute_with_backoff(
+                writer.sheet.batchUpdate(
+                    spreadsheetId=spreadsheetId, body=batch_write_request
+                )
+            )
+
+    def add_sheets(
+        self,
+        unwritten_classes: set,
+        class_idx: dict,
+        all_caps: list,
+        class_writer: Sheet,
+    ) -> None:
+        """
+        Method to create new sheets.
+        Errors out w/ HTTP Error if the requested sheets already exist.
+        Also, creates the formatted header for the sheet.
+        Everything goes out as ONE batchUpdate: the API processes the
+        requests array in order, so the header write and the header
+        formatting can reference the sheetId their addSheet picked in
+        the same call. 1 write request against the quota instead of 3.
+        """
+        if len(unwritten_classes) == 0:
+            # don't bother making requests if there are none to be made
+            return
+
+        # header labels for each new sheet
+        data = [
+            "#",
+            "UUID",
+            "First Name",
+            "Last Name",
+            "Email",
+            "Note",
+            "Parent 1 UUID",
+            "Parent 2 UUID",
+        ]
+
+        requests = []
+        for cls in unwritten_classes:
+            requests.append(
+                {
+                    "addSheet": {
+                        "properties": {
+                            "title": cls,
+                            # this sheetId refers merely to an id for the sheet
+                            "sheetId": cls,
+                            "gridProperties": {
+                                "rowCount": int(all_caps[class_idx[cls]]) + 1,
+                                "columnCount": 26,
+                            },
+                        }
+                    }
+                }
+            )
+            # make the header for the new sheet
+            requests.append(
+                {
+                    "updateCells": {
+                        "start": {
+                            "sheetId": cls,
+                            "rowIndex": 0,
+                            "columnIndex": 0,
+                        },
+                        "rows": [
+                            {
+                                "values": [
+                                    {"userEnteredValue": {"stringValue": str(thing)}}
+                                    for thing in data
+                                ]
+                            }
+                        ],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            )
+            # format the new header (green bg, bold black text)
+            requests.append(
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": cls,
+                            "startRowIndex": 0,
+                            "endRowIndex": 1,
+                            "startColumnIndex": 0,
+                            "endColumnIndex": 8,
+                        },
+                        "cell": {
+                            "userEnteredFormat": {
+                                # rgb(52, 245, 197)
+                                "backgroundColor": {
+                                    "red": 52 / 255,
+                                    "green": 245 / 255,
+                                    "blue": 197 / 255,
+                                },
+                                "horizontalAlignment": "LEFT",
+                                "textFormat": {
+                                    "foregroundColor": {
+                                        "red": 0.0,
+                                        "green": 0.0,
+                                        "blue": 0.0,
+                                    },
+                                    "bold": True,
+                                },
+                            }
+                        },
+                        "fields": str(
+                            "userEnteredFormat(backgroundColor,textFormat,"
+                            + "horizontalAlignment)"
+                        ),
+                    }
+                }
+            )
+
+        execute_with_backoff(
+            class_writer.sheet.batchUpdate(
+                spreadsheetId=StudTeachSheet.SHEET_ID, body={"requests": requests}
+            )
+        )
+        # the cached metadata no longer lists every subsheet
+        class_writer._metadata = None
+
+        print("created new subsheets for the following class codes", unwritten_classes)
+
+    def add_teacher(self, teacher: Teacher) -> None:
+        """
+        Registers a Teacher in both self.teachers and the identity
+        index, so later getMatchingTeacher calls can find them.
+        """
+        self.teachers[teacher.id] = teacher
+        self._teacher_index[
+            (teacher.full_name.lower(), teacher.email, teacher.phone)
+        ] = teacher
+
+    def getMatchingTeacher(
+        self, full_name: str, email: str, phone: str
+    ) -> Union[Teacher, None]:
+        # returns None for an unknown (ie new) teacher; this replaces
+        # the old isNewTeacher/getMatchingTeacher pair of linear scans
+        return self._teacher_index.get((full_name.lower(), email, phone))
+
+    def write_placements(self):
+        all_data = SheetBatchGet(StudTeachSheet.SHEET_ID, service=self.service)
+        all_rosters = {
+            code: SheetLike(all_data.sheet_data[code]) for code in all_data.sheet_data
+        }
+        writer = Sheet(
+            StudTeachSheet.SHEET_ID,
+            StudTeachSheet.SHEET_NAME,
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            prefetched_values={"values": self.spreadsheet},
+            service=self.service,
+        )
+
+        # welcome emails go out on a background worker so their SMTP
+        # round trips overlap the placement bookkeeping instead of
+        # stalling it; a single worker because the Emailer holds one
+        # SMTP connection, which must not be shared between threads
+        email_pool = ThreadPoolExecutor(max_workers=1)
+        email_sends = []
+
+        for student in self.students.values():
+            for code in student.classes:
+                if student.id not in self.classes[code].students:
+                    """roster = Sheet(
+                        StudTeachSheet.SHEET_ID,
+                        code,
+                        StudTeachSheet.SCOPES,
+                        StudTeachSheet.PATH_TO_CREDS,
+                    )"""
+                    roster = all_rosters[code]
+
+                    stud_info = [
+                        0,
+                        student.id,
+                        student.first,
+                        student.last,
+                        student.email,
+                        student.note,
+                        student.parents[0],
+                    ]
+
+                    if len(student.parents) == 2:
+                        stud_info.append(student.parents[1])
+
+                    self.classes[code].students.append(student.id)
+
+                    # the cursor remembers how far previous placements
+                    # got, so this is not a fresh column scan per student
+                    i = roster.first_blank_row_in_col(1)
+                    if i is not None:
+                        stud_info[0] = i
+                        roster.simulate_write_row(stud_info, i)
+                        # queue the blank-row overwrite; it goes out
+                        # with all the others in one values.batchUpdate
+                        # instead of one Sheet + write_row per student
+                        writer.prepare_value_write(stud_info, i, sheet_name=code)
+                    else:
+                        i = len(self.classes[code].students)
+                        stud_info[0] = i
+                        roster.simulate_write_row(stud_info, i)
+                        writer.prepare_batch_write_row(stud_info, code)
+
+                    recipients = []
+                    for p_id in student.parents:
+                        recipients.append(self.parents[p_id].email)
+
+                    email_sends.append(
+                        email_pool.submit(
+                            self.StudRegSheet.Emailer.send_welcome_emails,
+                            recipients,
+                            student.full_name,
+                            code,
+                        )
+                    )
+
+        # if the batches are empty, these just don't bother with them
+        if len(writer.batch_write_request["requests"]) != 0:
+            writer.run_batch_update()
+        writer.flush_value_writes()
+
+        # don't return until every queued email has actually been sent,
+        # and surface anything that failed on the worker: a future
+        # swallows its exception until result() is called, so without
+        # this a dead SMTP login would look like a successful run
+        email_pool.shutdown(wait=True)
+        for send in email_sends:
+            send.result()
+
+    def write_parents(self):
+        roster = Sheet(
+            StudTeachSheet.SHEET_ID,
+            "Parents",
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            service=self.service,
+        )
+        uuids = roster.get_column(0)
+        length = len(uuids)
+
+        # a set makes the membership check O(1) instead of a scan of
+        # the uuid column per parent, and the queued writes all go out
+        # in one values.batchUpdate instead of one request per parent
+        uuid_set = set(uuids)
+        for parent in self.parents.values():
+            if parent.id not in uuid_set:
+                parent_info = [
+                    parent.id,
+                    parent.first,
+                    parent.last,
+                    parent.email,
+                ]
+
+                roster.prepare_value_write(parent_info, length)
+                uuid_set.add(parent.id)
+                length += 1
+
+        roster.flush_value_writes()
+
+    def get_teachers(self):
+        teachers = {}
+        teacher_list = Sheet(
+            StudTeachSheet.SHEET_ID,
+            "Teachers",
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            service=self.service,
+        )
+
+        for i in range(1, len(teacher_list.get_column(0))):
+            row = teacher_list.get_row(i)
+
+            if len(row) < 5:
+                continue
+
+            teachers[row[0]] = Teacher(row[1], row[2], row[3], row[4], [])
+            teachers[row[0]].id = row[0]
+
+        return teachers
+
+    def get_classes(self):
+        classes = {}
+
+        # only make 1 read request instead of making
+        # many individual requests
+        all_rosters = SheetBatchGet(
+            StudTeachSheet.SHEET_ID,
+            self.get_column(0)[1:],
+            StudTeachSheet.SCOPES,
+            StudTeachSheet.PATH_TO_CREDS,
+            service=self.service,
+        )
+
+        for i in range(1, len(self.get_column(0))):
+            row = self.get_row(i)
+
+            if len(row) < 9 or row[0] == "":
+                continue
+
+            code = row[0]
+            classes[code] = Class(code, row[7], [row[5]], [], int(row[8]))
+            self.teachers[row[5]].classes.append(code)
+
+            if row[6].strip() != "":
+                classes[code].teachers.append(row[6])
+                self.teachers[row[6]].classes.append(code)
+
+            # READONLY roster
+            roster = SheetLike(all_rosters.sheet_data[code])
+
+            for i in range(1, len(roster.get_column(1))):
+                classes[code].students.append(roster.get_column(1)[i])
+
+        return classes